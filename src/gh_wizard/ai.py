@@ -1,31 +1,70 @@
 """AI and pattern learning utilities."""
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import json
+import sys
+import time
+from typing import Dict, List, Any, Optional, BinaryIO, Tuple
+from datetime import datetime
 from pathlib import Path
+from bisect import bisect_right
 from collections import Counter
+from operator import itemgetter
 
+import orjson
+
+from gh_wizard.utils.fileio import atomic_write_bytes
 from gh_wizard.utils.logger import setup_logger
+from gh_wizard.utils.paths import BASE_DIR
 
 logger = setup_logger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated action types and repos share one object.
+    
+    Counter lookups on interned keys succeed on the identity check before
+    falling back to a full string compare.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class PatternLearner:
     """Learn patterns from user workflows."""
 
-    def __init__(self, history_file: Optional[Path] = None):
+    def __init__(self, history_file: Optional[Path] = None, window_days: int = 7):
         """Initialize pattern learner.
         
         Args:
-            history_file: Path to history file. Defaults to ~/.ghwizard/history.json
+            history_file: Path to history file (one JSON entry per line).
+                Defaults to BASE_DIR/history.jsonl. A JSON array left at the
+                same path with a .json suffix is imported on first run
+            window_days: Look-back window kept as rolling counters, making
+                get_common_patterns for this many days incremental
         """
         if history_file is None:
-            history_file = Path.home() / ".ghwizard" / "history.json"
+            history_file = BASE_DIR / "history.jsonl"
         
         self.history_file = history_file
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        if not self.history_file.exists():
+            self._migrate_legacy_history()
         self.history = self._load_history()
+        self._history_handle: Optional[BinaryIO] = None
+        
+        # (epoch seconds, type, repo) per entry, oldest first, with the epochs
+        # mirrored in _timestamps for bisecting; entries before _window_start
+        # have aged out of the rolling counters. Epochs are clamped to never
+        # decrease, so the list stays sorted even if the clock stepped back.
+        self.window_days = window_days
+        self._events: List[Tuple[float, str, Optional[str]]] = []
+        latest = float("-inf")
+        for entry in self.history:
+            timestamp, action_type, repo = self._to_event(entry)
+            latest = max(latest, timestamp)
+            self._events.append((latest, action_type, repo))
+        self._timestamps: List[float] = [e[0] for e in self._events]
+        self._window_start = 0
+        self._action_counts: Counter[str] = Counter(t for _, t, _ in self._events)
+        self._repo_counts: Counter[str] = Counter(r for _, _, r in self._events if r is not None)
 
     def record_action(self, action_type: str, details: Dict[str, Any]) -> None:
         """Record an action for pattern learning.
@@ -34,13 +73,25 @@ class PatternLearner:
             action_type: Type of action (e.g., 'commit', 'pr_created', 'issue_resolved')
             details: Action details
         """
+        timestamp = time.time()
+        if self._timestamps:
+            # Keep _timestamps sorted for bisecting if the clock stepped back
+            timestamp = max(timestamp, self._timestamps[-1])
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "type": action_type,
             "details": details,
         }
         self.history.append(entry)
-        self._save_history()
+        self._append_history(entry)
+        
+        action_type = _intern(action_type)
+        repo = _intern(details.get("repo"))
+        self._events.append((timestamp, action_type, repo))
+        self._timestamps.append(timestamp)
+        self._action_counts[action_type] += 1
+        if repo is not None:
+            self._repo_counts[repo] += 1
         logger.debug(f"Action recorded: {action_type}")
 
     def get_common_patterns(self, days: int = 7) -> Dict[str, Any]:
@@ -52,28 +103,28 @@ class PatternLearner:
         Returns:
             Dictionary of patterns and frequencies
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        recent = []
+        cutoff = time.time() - days * 86400
         
-        for entry in self.history:
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            if timestamp > cutoff:
-                recent.append(entry)
-        
-        # Count action types
-        action_counts = Counter(e["type"] for e in recent)
-        
-        # Count repos
-        repo_counts: Counter[str] = Counter()
-        for e in recent:
-            if "repo" in e["details"]:
-                repo_counts[e["details"]["repo"]] += 1
+        if days == self.window_days:
+            self._evict_until(cutoff)
+            action_counts = self._action_counts
+            repo_counts = self._repo_counts
+            total = len(self._events) - self._window_start
+        else:
+            recent = self._events[bisect_right(self._timestamps, cutoff):]
+            action_counts = Counter(t for _, t, _ in recent)
+            repo_counts = Counter(r for _, _, r in recent if r is not None)
+            total = len(recent)
         
         return {
             "period_days": days,
-            "total_actions": len(recent),
-            "action_distribution": dict(action_counts.most_common()),
-            "repo_distribution": dict(repo_counts.most_common()),
+            "total_actions": total,
+            "action_distribution": dict(
+                sorted(action_counts.items(), key=itemgetter(1), reverse=True)
+            ),
+            "repo_distribution": dict(
+                sorted(repo_counts.items(), key=itemgetter(1), reverse=True)
+            ),
         }
 
     def suggest_next_steps(self, current_context: Dict[str, Any]) -> List[str]:
@@ -94,22 +145,94 @@ class PatternLearner:
         logger.debug(f"Generated {len(suggestions)} suggestions")
         return suggestions
 
+    def close(self) -> None:
+        """Flush and close the history file handle."""
+        if self._history_handle is not None:
+            try:
+                self._history_handle.close()
+            except Exception as e:
+                logger.error(f"Failed to close history: {e}")
+            self._history_handle = None
+
+    def __del__(self) -> None:
+        """Close the history file handle on garbage collection."""
+        if getattr(self, "_history_handle", None) is not None:
+            self.close()
+
     # Private methods
+    @staticmethod
+    def _to_event(entry: Dict[str, Any]) -> Tuple[float, str, Optional[str]]:
+        """Convert a history entry to an (epoch seconds, type, repo) event."""
+        timestamp = entry["timestamp"]
+        if isinstance(timestamp, str):
+            # Entries recorded before timestamps were stored as epoch seconds
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        return timestamp, _intern(entry["type"]), _intern(entry["details"].get("repo"))
+
+    def _evict_until(self, cutoff: float) -> None:
+        """Drop events at or before cutoff from the rolling counters."""
+        end = bisect_right(self._timestamps, cutoff, lo=self._window_start)
+        for _, action_type, repo in self._events[self._window_start:end]:
+            self._decrement(self._action_counts, action_type)
+            if repo is not None:
+                self._decrement(self._repo_counts, repo)
+        self._window_start = end
+
+    @staticmethod
+    def _decrement(counts: Counter, key: str) -> None:
+        """Decrement a count, removing the key once it reaches zero."""
+        if counts[key] <= 1:
+            del counts[key]
+        else:
+            counts[key] -= 1
+
+    def _migrate_legacy_history(self) -> None:
+        """Import history saved as a single JSON array by older versions.
+        
+        The entries are rewritten one per line and the old file is renamed
+        to *.json.migrated, so the import only happens once.
+        """
+        legacy_file = self.history_file.with_suffix(".json")
+        if legacy_file == self.history_file or not legacy_file.exists():
+            return
+        try:
+            entries = orjson.loads(legacy_file.read_bytes())
+            if not isinstance(entries, list):
+                raise ValueError("expected a list of entries")
+            atomic_write_bytes(
+                self.history_file, b"".join(orjson.dumps(e) + b"\n" for e in entries)
+            )
+            legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+        except Exception as e:
+            logger.warning(f"Failed to import legacy history: {e}")
+            return
+        logger.info(f"Imported {len(entries)} entries from {legacy_file}")
+
     def _load_history(self) -> List[Dict[str, Any]]:
         """Load history from file."""
+        history: List[Dict[str, Any]] = []
         if self.history_file.exists():
             try:
-                with open(self.history_file) as f:
-                    result: List[Dict[str, Any]] = json.load(f)
-                    return result
+                lines = self.history_file.read_bytes().splitlines()
             except Exception as e:
                 logger.warning(f"Failed to load history: {e}")
-        return []
+                return history
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    history.append(orjson.loads(line))
+                except orjson.JSONDecodeError as e:
+                    # A crash mid-append can leave a truncated last line
+                    logger.warning(f"Skipping corrupt history entry: {e}")
+        return history
 
-    def _save_history(self) -> None:
-        """Save history to file."""
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """Append a single entry to the history file."""
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.history, f, indent=2)
+            if self._history_handle is None:
+                self._history_handle = open(self.history_file, "ab")
+            self._history_handle.write(orjson.dumps(entry) + b"\n")
+            self._history_handle.flush()
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
@@ -1,24 +1,95 @@
 """Main CLI entry point for GitHub Wizard."""
 
 import click
+import functools
+import os
 import time
-import msvcrt
+import queue
 import sys
-from rich.console import Console
-from rich.live import Live
-from rich.prompt import Prompt, Confirm
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple
 
 from gh_wizard.utils.logger import setup_logger
-from gh_wizard.ui.dashboard import show_dashboard
-from gh_wizard.session import SessionManager
-from gh_wizard.pomodoro import PomodoroSession, notify_phase_complete, BreakReminder
-from gh_wizard.progress_tracker import ProgressDisplay
-from gh_wizard.priorities import EisenhowerMatrix, Task
-from gh_wizard.stats import StatsManager
-
-console = Console()
+from gh_wizard.utils.paths import BASE_DIR
+
+# Feature modules (and Rich) are imported inside the commands that use them,
+# so `gh wizard --help` only pays for click
+if TYPE_CHECKING:
+    from rich.console import Console
+    from gh_wizard.pomodoro import PomodoroSession, BreakReminder
+    from gh_wizard.priorities import EisenhowerMatrix
+    from gh_wizard.progress_tracker import ProgressDisplay
+    from gh_wizard.stats import StatsManager
+
+IS_WINDOWS = sys.platform == "win32"
+if IS_WINDOWS:
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
+
+class _LazyConsole:
+    """Stand-in for the shared Rich console that creates it on first use."""
+
+    _console: Optional["Console"] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            from gh_wizard.ui._console import console as shared_console
+            _LazyConsole._console = shared_console
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
 logger = setup_logger(__name__)
 
+MATRIX_FILE = "eisenhower_matrix.json"
+
+# Pomodoro loop timing (seconds)
+KEY_POLL_INTERVAL = 0.1
+PAUSED_WAKE_INTERVAL = 1.0
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    """Get (mtime_ns, size) for a file, or (0, 0) if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_matrix(path: str, signature: Tuple[int, int]) -> "EisenhowerMatrix":
+    """Load the matrix once per file version (signature is the cache key)."""
+    from gh_wizard.priorities import EisenhowerMatrix
+    matrix = EisenhowerMatrix()
+    matrix.load(path)
+    return matrix
+
+
+@functools.lru_cache(maxsize=4)
+def _load_stats_manager(path: str, signature: Tuple[int, int]) -> "StatsManager":
+    """Load the stats once per file version (signature is the cache key)."""
+    from gh_wizard.stats import StatsManager
+    return StatsManager(stats_file=Path(path))
+
+
+def _get_matrix() -> "EisenhowerMatrix":
+    """Get the task matrix, reusing the loaded copy until the file changes."""
+    path = os.path.abspath(MATRIX_FILE)
+    return _load_matrix(path, _file_signature(path))
+
+
+def _get_stats_manager() -> "StatsManager":
+    """Get the stats manager, reusing the loaded copy until the file changes."""
+    path = str(BASE_DIR / "stats.json")
+    return _load_stats_manager(path, _file_signature(path))
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -42,6 +113,7 @@ def start_session(name: str):
         gh wizard session start "HyperCode feature work"
     """
     try:
+        from gh_wizard.session import SessionManager
         manager = SessionManager()
         session_id = manager.start(name)
         console.print(f"[green]✨ Session started: {name}[/green]")
@@ -55,6 +127,7 @@ def start_session(name: str):
 def resume():
     """Resume your last hyperfocus session."""
     try:
+        from gh_wizard.session import SessionManager
         manager = SessionManager()
         session = manager.get_last_session()
         if session:
@@ -72,6 +145,7 @@ def resume():
 def pause():
     """Pause current session and save context."""
     try:
+        from gh_wizard.session import SessionManager
         manager = SessionManager()
         manager.pause()
         console.print("[yellow]⏸️  Session paused[/yellow]")
@@ -84,6 +158,7 @@ def pause():
 def list_sessions_command():
     """List all saved sessions."""
     try:
+        from gh_wizard.session import SessionManager
         manager = SessionManager()
         sessions = manager.list_sessions()
         if sessions:
@@ -101,6 +176,7 @@ def list_sessions_command():
 def dashboard():
     """Show dashboard with all repo status."""
     try:
+        from gh_wizard.ui.dashboard import show_dashboard
         show_dashboard()
     except Exception as e:
         console.print(f"[red]❌ Error loading dashboard: {e}[/red]")
@@ -111,7 +187,7 @@ def dashboard():
 def stats():
     """Show daily session statistics."""
     try:
-        manager = StatsManager()
+        manager = _get_stats_manager()
         stats = manager.get_today_stats()
         
         console.print(f"[bold]📊 Today's Stats ({stats.date})[/bold]")
@@ -168,6 +244,182 @@ def pomodoro():
     """🍅 Pomodoro Timer - Focus & Break management."""
 
 
+def _win_read_keys(keys: "queue.Queue[str]", stop: threading.Event) -> None:
+    """Forward console keystrokes into the queue until stopped (Windows)."""
+    kbhit, getwch, put = msvcrt.kbhit, msvcrt.getwch, keys.put
+    is_stopped, wait = stop.is_set, stop.wait
+    while not is_stopped():
+        if kbhit():
+            put(getwch().lower())
+        else:
+            wait(KEY_POLL_INTERVAL)
+
+
+def _posix_read_keys(keys: "queue.Queue[str]", stop: threading.Event) -> None:
+    """Forward stdin keystrokes into the queue until stopped (Linux/macOS)."""
+    fd = sys.stdin.fileno()
+    put, is_stopped = keys.put, stop.is_set
+    while not is_stopped():
+        ready, _, _ = select.select([fd], [], [], KEY_POLL_INTERVAL)
+        if ready:
+            for char in os.read(fd, 32).decode("utf-8", errors="ignore"):
+                put(char.lower())
+
+
+# Resolved once so the reader loop never branches on the platform
+_read_keys = _win_read_keys if IS_WINDOWS else _posix_read_keys
+
+
+@contextmanager
+def _key_reader() -> Iterator["queue.Queue[str]"]:
+    """Read keystrokes from a daemon thread into a queue.
+    
+    Keeping input off the main thread lets the Pomodoro loop block on the
+    queue instead of waking up to poll the keyboard itself. On POSIX the
+    terminal is switched to cbreak mode for the duration, so single key
+    presses arrive without Enter; Ctrl+C still raises KeyboardInterrupt.
+    """
+    keys: "queue.Queue[str]" = queue.Queue()
+    stop = threading.Event()
+    
+    saved_mode = None
+    if not IS_WINDOWS:
+        if not sys.stdin.isatty():
+            # No terminal to read from; the timer still runs, just without controls
+            yield keys
+            return
+        saved_mode = termios.tcgetattr(sys.stdin)
+        tty.setcbreak(sys.stdin)
+    
+    thread = threading.Thread(target=_read_keys, args=(keys, stop), name="pomodoro-keys", daemon=True)
+    thread.start()
+    try:
+        yield keys
+    finally:
+        stop.set()
+        thread.join(KEY_POLL_INTERVAL * 2)
+        if saved_mode is not None:
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, saved_mode)
+
+
+def _find_task(matrix: "EisenhowerMatrix", query: str) -> Optional[str]:
+    """Find a task by exact ID, falling back to a case-insensitive title match.
+    
+    Args:
+        matrix: Loaded Eisenhower Matrix
+        query: Task ID or title substring
+        
+    Returns:
+        ID of the first matching task, or None if nothing matches
+    """
+    if query in matrix.tasks:
+        return query
+    
+    needle = query.lower()
+    for task_id, task in matrix.tasks.items():
+        if needle in task.title.lower():
+            return task_id
+    return None
+
+
+def _advance_phase(
+    pomodoro_session: "PomodoroSession",
+    stats_manager: "StatsManager",
+    break_reminder: "BreakReminder",
+) -> None:
+    """Record stats for the finished phase and switch to the next one."""
+    from gh_wizard.pomodoro import notify_phase_complete
+    
+    if pomodoro_session.current_phase == "work":
+        stats_manager.record_work_session(pomodoro_session.work_minutes)
+    else:
+        stats_manager.record_break()
+    
+    pomodoro_session.next_phase()
+    notify_phase_complete(pomodoro_session.current_phase)
+    
+    if pomodoro_session.current_phase != "work":
+        suggestion = break_reminder.get_break_suggestion(pomodoro_session.completed_sessions)
+        console.print(f"\n[bold blue]🎉 Break Time! {suggestion}[/bold blue]")
+
+
+def _run_pomodoro(
+    pomodoro_session: "PomodoroSession",
+    display: "ProgressDisplay",
+    stats_manager: "StatsManager",
+    break_reminder: "BreakReminder",
+    task_title: Optional[str] = None,
+) -> None:
+    """Run the Pomodoro event loop until the session is stopped.
+    
+    Args:
+        pomodoro_session: Started Pomodoro session
+        display: Display used to render the timer
+        stats_manager: Stats manager recording finished phases
+        break_reminder: Source of break suggestions
+        task_title: Optional task being worked on
+    """
+    from rich.live import Live
+    from gh_wizard.ui._console import console as shared_console
+    
+    # Bind the per-tick calls once rather than resolving them every pass
+    render = display.render_pomodoro_display
+    is_phase_complete = pomodoro_session.is_phase_complete
+    get_remaining_seconds = pomodoro_session.get_remaining_seconds
+    seconds_to_next_tick = pomodoro_session.seconds_to_next_tick
+    
+    def displayed_state() -> Tuple[int, str, int]:
+        # Everything the timer panel shows follows from these values
+        return (
+            get_remaining_seconds(),
+            pomodoro_session.current_phase,
+            pomodoro_session.completed_sessions,
+        )
+    
+    try:
+        last_state = displayed_state()
+        initial = render(pomodoro_session, task_title=task_title)
+        live_display = Live(initial, console=shared_console, refresh_per_second=4)
+        with _key_reader() as keys, live_display as live:
+            get_key = keys.get
+            update = live.update
+            while pomodoro_session.is_running:
+                # Sleep until a key arrives or the shown second changes. The
+                # remaining time stands still while paused, but keep waking
+                # occasionally so Ctrl+C is still delivered on Windows.
+                if pomodoro_session.is_paused:
+                    timeout = PAUSED_WAKE_INTERVAL
+                else:
+                    timeout = seconds_to_next_tick()
+                try:
+                    key: Optional[str] = get_key(timeout=timeout)
+                except queue.Empty:
+                    key = None
+                
+                if key == 'p':
+                    pomodoro_session.pause()
+                elif key == 'r':
+                    pomodoro_session.resume()
+                elif key == 's':
+                    pomodoro_session.stop()
+                    break
+                elif key == 'n':
+                    _advance_phase(pomodoro_session, stats_manager, break_reminder)
+                
+                if not pomodoro_session.is_paused and is_phase_complete():
+                    _advance_phase(pomodoro_session, stats_manager, break_reminder)
+                
+                # Only rebuild the panel when the shown second or phase changes
+                state = displayed_state()
+                if state != last_state:
+                    update(render(pomodoro_session, task_title=task_title))
+                    last_state = state
+    
+    except KeyboardInterrupt:
+        pomodoro_session.stop()
+        console.print("\n[yellow]Timer stopped.[/yellow]")
+
+
 @pomodoro.command(name="start")
 @click.option("--work", default=25, help="Work duration in minutes")
 @click.option("--short", default=5, help="Short break duration in minutes")
@@ -181,9 +433,12 @@ def start_pomodoro(work: int, short: int, long: int):
         n: Next phase
         s: Stop
     """
+    from gh_wizard.pomodoro import PomodoroSession, BreakReminder
+    from gh_wizard.progress_tracker import ProgressDisplay
+    
     pomodoro_session = PomodoroSession(work_minutes=work, short_break_minutes=short, long_break_minutes=long)
     display = ProgressDisplay()
-    stats_manager = StatsManager()
+    stats_manager = _get_stats_manager()
     break_reminder = BreakReminder()
     
     pomodoro_session.start()
@@ -191,55 +446,7 @@ def start_pomodoro(work: int, short: int, long: int):
     console.print("[bold green]🍅 Pomodoro Timer Started![/bold green]")
     console.print("[dim]Press 'p' to pause, 'r' to resume, 'n' to next phase, 's' or Ctrl+C to stop[/dim]")
     
-    try:
-        with Live(display.render_pomodoro_display(pomodoro_session), refresh_per_second=4) as live:
-            while pomodoro_session.is_running:
-                # Check for keyboard input
-                if msvcrt.kbhit():
-                    try:
-                        key = msvcrt.getch().decode('utf-8').lower()
-                        if key == 'p':
-                            pomodoro_session.pause()
-                        elif key == 'r':
-                            pomodoro_session.resume()
-                        elif key == 's':
-                            pomodoro_session.stop()
-                            break
-                        elif key == 'n':
-                            # Record stats before switching if completing work
-                            if pomodoro_session.current_phase == "work":
-                                stats_manager.record_work_session(pomodoro_session.work_minutes)
-                            else:
-                                stats_manager.record_break()
-                            pomodoro_session.next_phase()
-                            notify_phase_complete(pomodoro_session.current_phase)
-                            if pomodoro_session.current_phase != "work":
-                                suggestion = break_reminder.get_break_suggestion()
-                                console.print(f"\n[bold blue]🎉 Break Time! {suggestion}[/bold blue]")
-                    except UnicodeDecodeError:
-                        pass
-                
-                if not pomodoro_session.is_paused:
-                    if pomodoro_session.is_phase_complete():
-                        # Record stats
-                        if pomodoro_session.current_phase == "work":
-                            stats_manager.record_work_session(pomodoro_session.work_minutes)
-                        else:
-                            stats_manager.record_break()
-                            
-                        pomodoro_session.next_phase()
-                        notify_phase_complete(pomodoro_session.current_phase)
-                        
-                        if pomodoro_session.current_phase != "work":
-                            suggestion = break_reminder.get_break_suggestion()
-                            console.print(f"\n[bold blue]🎉 Break Time! {suggestion}[/bold blue]")
-
-                live.update(display.render_pomodoro_display(pomodoro_session))
-                time.sleep(0.1)
-                
-    except KeyboardInterrupt:
-        pomodoro_session.stop()
-        console.print("\n[yellow]Timer stopped.[/yellow]")
+    _run_pomodoro(pomodoro_session, display, stats_manager, break_reminder)
 
 
 @pomodoro.command(name="work-on")
@@ -248,86 +455,37 @@ def start_pomodoro(work: int, short: int, long: int):
 def work_on_task(task_id: str, work: int):
     """Start a Pomodoro session for a specific task."""
     try:
-        matrix = EisenhowerMatrix()
-        matrix.load()
+        from rich.prompt import Confirm
+        from gh_wizard.pomodoro import PomodoroSession, BreakReminder
+        from gh_wizard.progress_tracker import ProgressDisplay
         
-        # Find task
-        found_task = None
-        found_id = None
-        if task_id in matrix.tasks:
-            found_id = task_id
-            found_task = matrix.tasks[task_id]
-        else:
-            for tid, t in matrix.tasks.items():
-                if task_id.lower() in t.title.lower():
-                    found_id = tid
-                    found_task = t
-                    break
+        matrix = _get_matrix()
         
-        if not found_task:
+        found_id = _find_task(matrix, task_id)
+        if found_id is None:
             console.print(f"[red]❌ Task '{task_id}' not found.[/red]")
             return
+        found_task = matrix.tasks[found_id]
             
         console.print(f"[bold green]🎯 Working on: {found_task.title}[/bold green]")
         
         # Start timer with task context
         pomodoro_session = PomodoroSession(work_minutes=work)
         display = ProgressDisplay()
-        stats_manager = StatsManager()
+        stats_manager = _get_stats_manager()
         break_reminder = BreakReminder()
         
         pomodoro_session.start()
         
         console.print("[dim]Press 'p' to pause, 'r' to resume, 'n' to next phase, 's' or Ctrl+C to stop[/dim]")
         
-        try:
-            with Live(display.render_pomodoro_display(pomodoro_session, task_title=found_task.title), refresh_per_second=4) as live:
-                while pomodoro_session.is_running:
-                    if msvcrt.kbhit():
-                        try:
-                            key = msvcrt.getch().decode('utf-8').lower()
-                            if key == 'p': pomodoro_session.pause()
-                            elif key == 'r': pomodoro_session.resume()
-                            elif key == 's': 
-                                pomodoro_session.stop()
-                                break
-                            elif key == 'n':
-                                if pomodoro_session.current_phase == "work":
-                                    stats_manager.record_work_session(pomodoro_session.work_minutes)
-                                else:
-                                    stats_manager.record_break()
-                                pomodoro_session.next_phase()
-                                notify_phase_complete(pomodoro_session.current_phase)
-                                if pomodoro_session.current_phase != "work":
-                                    suggestion = break_reminder.get_break_suggestion(pomodoro_session.completed_sessions)
-                                    console.print(f"\n[bold blue]🎉 Break Time! {suggestion}[/bold blue]")
-                        except UnicodeDecodeError:
-                            pass
-                    
-                    if not pomodoro_session.is_paused and pomodoro_session.is_phase_complete():
-                        if pomodoro_session.current_phase == "work":
-                            stats_manager.record_work_session(pomodoro_session.work_minutes)
-                        else:
-                            stats_manager.record_break()
-                        
-                        pomodoro_session.next_phase()
-                        notify_phase_complete(pomodoro_session.current_phase)
-                        
-                        if pomodoro_session.current_phase != "work":
-                            suggestion = break_reminder.get_break_suggestion(pomodoro_session.completed_sessions)
-                            console.print(f"\n[bold blue]🎉 Break Time! {suggestion}[/bold blue]")
-                    
-                    live.update(display.render_pomodoro_display(pomodoro_session, task_title=found_task.title))
-                    time.sleep(0.1)
-                    
-        except KeyboardInterrupt:
-            pomodoro_session.stop()
-            console.print("\n[yellow]Timer stopped.[/yellow]")
+        _run_pomodoro(
+            pomodoro_session, display, stats_manager, break_reminder, task_title=found_task.title
+        )
             
         # Ask to complete task
         if Confirm.ask(f"Did you complete '{found_task.title}'?"):
-            if found_id:
-                matrix.mark_complete(found_id)
+            matrix.mark_complete(found_id)
             matrix.save()
             stats_manager.record_task_completion()
             console.print("[green]✅ Task completed![/green]")
@@ -342,20 +500,10 @@ def work_on_task(task_id: str, work: int):
 def complete_pomodoro_task(task_id: str):
     """Complete a task from the matrix and record stats."""
     try:
-        matrix = EisenhowerMatrix()
-        matrix.load()
-        stats_manager = StatsManager()
-        
-        # Reuse search logic or just try direct first
-        found_id = None
-        if task_id in matrix.tasks:
-            found_id = task_id
-        else:
-            for tid, t in matrix.tasks.items():
-                if task_id.lower() in t.title.lower():
-                    found_id = tid
-                    break
+        matrix = _get_matrix()
+        stats_manager = _get_stats_manager()
         
+        found_id = _find_task(matrix, task_id)
         if found_id:
             matrix.mark_complete(found_id)
             matrix.save()
@@ -377,8 +525,10 @@ def priorities():
 @priorities.command(name="add")
 def add_task():
     """Add a new task to the matrix."""
-    matrix = EisenhowerMatrix()
-    matrix.load()
+    from rich.prompt import Prompt, Confirm
+    from gh_wizard.priorities import Task
+    
+    matrix = _get_matrix()
     
     title = Prompt.ask("Task title")
     urgent = Confirm.ask("Is it urgent?")
@@ -401,16 +551,14 @@ def add_task():
 @priorities.command(name="list")
 def list_tasks():
     """List tasks by priority."""
-    matrix = EisenhowerMatrix()
-    matrix.load()
+    matrix = _get_matrix()
     console.print(matrix.render_priority_list())
 
 
 @priorities.command(name="matrix")
 def show_matrix():
     """Show the Eisenhower Matrix."""
-    matrix = EisenhowerMatrix()
-    matrix.load()
+    matrix = _get_matrix()
     matrix.render_matrix()
 
 
@@ -418,28 +566,17 @@ def show_matrix():
 @click.argument("task_id", required=False)
 def complete_task(task_id: str):
     """Mark a task as complete."""
-    matrix = EisenhowerMatrix()
-    matrix.load()
+    from rich.prompt import Prompt
+    
+    matrix = _get_matrix()
     
     if not task_id:
         console.print(matrix.render_priority_list())
-        task_id = Prompt.ask("Enter Task ID (or title substring)")
-        
-        found = False
-        # Try exact match first
-        if task_id in matrix.tasks:
-            found = True
-        else:
-            # Try partial match
-            for tid, t in matrix.tasks.items():
-                if task_id.lower() in t.title.lower():
-                    task_id = tid
-                    found = True
-                    break
-        
-        if not found:
+        found_id = _find_task(matrix, Prompt.ask("Enter Task ID (or title substring)"))
+        if found_id is None:
             console.print("[red]Task not found.[/red]")
             return
+        task_id = found_id
 
     matrix.mark_complete(task_id)
     matrix.save()
@@ -1,19 +1,138 @@
 """GitHub GraphQL API client."""
 
 import os
+import ijson
+import orjson
 import requests
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Generator, Iterator, List, Tuple
+from pydantic import BaseModel, PrivateAttr
 from gh_wizard.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _compact(document: str) -> str:
+    """Collapse the whitespace in a GraphQL document; the parser ignores it."""
+    return " ".join(document.split())
+
+
+# Selection sets shared by the single-purpose queries and the dashboard bundle
+_REPO_STATUS_FIELDS = """
+    repositories(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
+        nodes {
+            name
+            description
+            url
+            issues(states: OPEN) {
+                totalCount
+            }
+            pullRequests(states: OPEN) {
+                totalCount
+            }
+            defaultBranchRef {
+                name
+            }
+        }
+    }
+"""
+
+_OPEN_ISSUES_FIELDS = """
+    issues(first: 20, states: OPEN) {
+        nodes {
+            number
+            title
+            labels(first: 5) {
+                nodes {
+                    name
+                }
+            }
+            createdAt
+        }
+    }
+"""
+
+_VIEWER_QUERY = _compact("""
+    query {
+        viewer {
+            login
+            name
+            bio
+            repositories(first: 10) {
+                nodes {
+                    name
+                    description
+                    url
+                }
+            }
+        }
+    }
+""")
+
+_REPOS_STATUS_QUERY = _compact(f"""
+    query GetReposStatus($first: Int!) {{
+        viewer {{
+            {_REPO_STATUS_FIELDS}
+        }}
+    }}
+""")
+
+_OPEN_ISSUES_QUERY = _compact(f"""
+    query GetIssues($owner: String!, $name: String!) {{
+        repository(owner: $owner, name: $name) {{
+            {_OPEN_ISSUES_FIELDS}
+        }}
+    }}
+""")
+
+
+class MissingDataError(LookupError):
+    """A streamed response has no value where the query projects its items."""
+
+
+def _require_prefix(
+    events: Iterator[Tuple[str, str, Any]], prefix: str
+) -> Iterator[Tuple[str, str, Any]]:
+    """Pass ijson parse events through, raising if prefix never held a value."""
+    found = False
+    for event_prefix, event, value in events:
+        if event_prefix == prefix and event != "null":
+            found = True
+        yield event_prefix, event, value
+    if not found:
+        raise MissingDataError(f"Response has no {prefix}")
+
+
+def _raise_on_errors(events: Iterator[Tuple[str, str, Any]]) -> Iterator[Tuple[str, str, Any]]:
+    """Pass ijson parse events through, raising if the response has errors.
+    
+    The errors array is rebuilt from its events, so the exception carries
+    the same payload as a non-streamed query's.
+    """
+    for prefix, event, value in events:
+        if prefix == "errors" and event == "start_array":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            for prefix, event, value in events:
+                builder.event(event, value)
+                if prefix == "errors" and event == "end_array":
+                    break
+            logger.error(f"GraphQL error: {builder.value}")
+            raise Exception(f"GraphQL error: {builder.value}")
+        yield prefix, event, value
+
+
+# The viewer query takes no variables, so its whole request body is constant
+_VIEWER_PAYLOAD = orjson.dumps({"query": _VIEWER_QUERY})
+
+
 class GitHubAPIClient(BaseModel):
     """Client for GitHub GraphQL API."""
 
     token: str
     endpoint: str = "https://api.github.com/graphql"
+    _session: requests.Session = PrivateAttr()
 
     class Config:
         """Pydantic config."""
@@ -30,6 +149,25 @@ class GitHubAPIClient(BaseModel):
         if not token:
             raise ValueError("GitHub token not found. Set GH_TOKEN or GITHUB_TOKEN env var.")
         super().__init__(token=token)
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session shared by all queries."""
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        })
+        # Queries are read-only, so retrying the POST on gateway errors is safe
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
 
     def query(self, query_string: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a GraphQL query.
@@ -44,94 +182,147 @@ class GitHubAPIClient(BaseModel):
         Raises:
             Exception: If query fails
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-        
         payload: Dict[str, Any] = {"query": query_string}
         if variables:
             payload["variables"] = variables
+        return self._post(orjson.dumps(payload))
+
+    def query_projection(
+        self,
+        query_string: str,
+        variables: Optional[Dict[str, Any]],
+        projection_prefix: str,
+    ) -> Generator[Any, None, None]:
+        """Execute a GraphQL query and stream the items under a prefix.
         
-        try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
+        The response body is parsed incrementally, so only one projected
+        item is held in memory at a time instead of the whole document.
+        
+        Items are yielded as soon as they are parsed. GraphQL errors raise
+        when the "errors" key is reached; if the server sends it after
+        "data", the items before it have already been yielded, so callers
+        that must not act on partial results should use query() instead.
+        
+        Args:
+            query_string: GraphQL query string
+            variables: Query variables
+            projection_prefix: ijson prefix of the items to yield,
+                e.g. "data.viewer.repositories.nodes.item"
             
-            data: Dict[str, Any] = response.json()
-            if "errors" in data:
-                logger.error(f"GraphQL error: {data['errors']}")
-                raise Exception(f"GraphQL error: {data['errors']}")
+        Yields:
+            Each item found under projection_prefix
             
-            result: Dict[str, Any] = data.get("data", {})
-            return result
-        except requests.RequestException as e:
+        Raises:
+            MissingDataError: If the response has no value to project from,
+                e.g. a null viewer
+            Exception: If query fails
+        """
+        payload: Dict[str, Any] = {"query": query_string}
+        if variables:
+            payload["variables"] = variables
+        # For "a.b.item", check that the list at "a.b" exists, even if empty
+        container = projection_prefix
+        if container.endswith(".item"):
+            container = container[: -len(".item")]
+        
+        try:
+            with self._session.post(
+                self.endpoint, data=orjson.dumps(payload), timeout=30, stream=True
+            ) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip encoding before ijson reads the stream
+                response.raw.decode_content = True
+                events = _raise_on_errors(ijson.parse(response.raw, use_float=True))
+                events = _require_prefix(events, container)
+                yield from ijson.items(events, projection_prefix)
+        except (requests.RequestException, ijson.JSONError) as e:
             logger.error(f"API request failed: {e}")
             raise
 
     def get_viewer_info(self) -> Dict[str, Any]:
         """Get authenticated user info."""
-        query = """
-            query {
-                viewer {
-                    login
-                    name
-                    bio
-                    repositories(first: 10) {
-                        nodes {
-                            name
-                            description
-                            url
-                        }
-                    }
-                }
-            }
-        """
-        return self.query(query)
+        return self._post(_VIEWER_PAYLOAD)
 
     def get_repos_status(self, first: int = 10) -> Dict[str, Any]:
         """Get status of user's repositories."""
-        query = """
-            query GetReposStatus($first: Int!) {
-                viewer {
-                    repositories(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                        nodes {
-                            name
-                            description
-                            url
-                            issues(states: OPEN) {
-                                totalCount
-                            }
-                            pullRequests(states: OPEN) {
-                                totalCount
-                            }
-                            defaultBranchRef {
-                                name
-                            }
-                        }
-                    }
-                }
-            }
-        """
-        return self.query(query, {"first": first})
+        return self.query(_REPOS_STATUS_QUERY, {"first": first})
+
+    def iter_repos_status(self, first: int = 10) -> Generator[Dict[str, Any], None, None]:
+        """Stream the user's repositories one status node at a time."""
+        return self.query_projection(
+            _REPOS_STATUS_QUERY, {"first": first}, "data.viewer.repositories.nodes.item"
+        )
 
     def get_open_issues(self, repo_owner: str, repo_name: str) -> Dict[str, Any]:
         """Get open issues for a repository."""
-        query = """
-            query GetIssues($owner: String!, $name: String!) {
-                repository(owner: $owner, name: $name) {
-                    issues(first: 20, states: OPEN) {
-                        nodes {
-                            number
-                            title
-                            labels(first: 5) {
-                                nodes {
-                                    name
-                                }
-                            }
-                            createdAt
-                        }
-                    }
-                }
-            }
+        return self.query(_OPEN_ISSUES_QUERY, {"owner": repo_owner, "name": repo_name})
+
+    def get_dashboard_bundle(
+        self, repo_refs: List[Tuple[str, str]], first: int = 10
+    ) -> Dict[str, Any]:
+        """Get viewer info, repo status and open issues in a single request.
+        
+        Each repository is fetched under its own field alias, so the whole
+        dashboard costs one round trip instead of one per query.
+        
+        Args:
+            repo_refs: (owner, name) pairs to fetch open issues for
+            first: Number of repositories to include in the status list
+            
+        Returns:
+            Dictionary with "viewer" (as in get_repos_status, plus login,
+            name and bio) and "repositories" mapping "owner/name" to the
+            repository data returned by get_open_issues
+        """
+        params = "".join(f", $o{i}: String!, $n{i}: String!" for i in range(len(repo_refs)))
+        repo_fields = "".join(
+            f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_OPEN_ISSUES_FIELDS} }}"
+            for i in range(len(repo_refs))
+        )
+        query = _compact(f"""
+            query GetDashboardBundle($first: Int!{params}) {{
+                viewer {{
+                    login
+                    name
+                    bio
+                    {_REPO_STATUS_FIELDS}
+                }}
+                {repo_fields}
+            }}
+        """)
+        variables: Dict[str, Any] = {"first": first}
+        for i, (owner, name) in enumerate(repo_refs):
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+        
+        data = self.query(query, variables)
+        return {
+            "viewer": data.get("viewer", {}),
+            "repositories": {
+                f"{owner}/{name}": data.get(f"r{i}")
+                for i, (owner, name) in enumerate(repo_refs)
+            },
+        }
+
+    # Private methods
+    def _post(self, body: bytes) -> Dict[str, Any]:
+        """POST an encoded GraphQL request body and return its data.
+        
+        Raises:
+            Exception: If query fails
         """
-        return self.query(query, {"owner": repo_owner, "name": repo_name})
+        try:
+            # Content-Type is set on the session, so the body can go as raw bytes
+            response = self._session.post(self.endpoint, data=body, timeout=30)
+            response.raise_for_status()
+            
+            data: Dict[str, Any] = orjson.loads(response.content)
+            if "errors" in data:
+                logger.error(f"GraphQL error: {data['errors']}")
+                raise Exception(f"GraphQL error: {data['errors']}")
+            
+            result: Dict[str, Any] = data.get("data", {})
+            return result
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"API request failed: {e}")
+            raise
@@ -1,8 +1,8 @@
 """Smart notification management."""
 
-from typing import List, Dict, Any, Optional
+from typing import Callable, FrozenSet, Iterable, List, Dict, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from gh_wizard.utils.logger import setup_logger
 
@@ -19,27 +19,58 @@ class NotificationPriority(str, Enum):
 
 class Notification(BaseModel):
     """Single notification."""
+    # Notifications are immutable once created, which also makes them hashable
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     message: str
     priority: NotificationPriority = NotificationPriority.NORMAL
     repo: Optional[str] = None
     url: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()  # Immutable default, shared instead of copied per instance
 
 
 class NotificationManager:
     """Manage and filter notifications intelligently."""
 
-    def __init__(self, dnd_mode: bool = False, watched_repos: Optional[List[str]] = None):
+    def __init__(self, dnd_mode: bool = False, watched_repos: Optional[Iterable[str]] = None):
         """Initialize notification manager.
         
         Args:
             dnd_mode: Do Not Disturb mode (silent)
-            watched_repos: List of repos to watch. If None, watch all.
+            watched_repos: Repos to watch. If None, watch all.
         """
-        self.dnd_mode = dnd_mode
-        self.watched_repos = watched_repos or []
+        self._dnd_mode = dnd_mode
+        self._watched_repos: FrozenSet[str] = frozenset(watched_repos or ())
+        self._accept = self._build_filter()
         self.notifications: List[Notification] = []
+        
+        # Buckets filled as notifications arrive, so lookups and summaries
+        # never rescan the full list
+        self._by_priority: Dict[str, List[Notification]] = {
+            p.value: [] for p in NotificationPriority
+        }
+        self._by_repo: Dict[str, List[Notification]] = {}
+
+    @property
+    def dnd_mode(self) -> bool:
+        """Do Not Disturb mode (silent)."""
+        return self._dnd_mode
+
+    @dnd_mode.setter
+    def dnd_mode(self, value: bool) -> None:
+        self._dnd_mode = value
+        self._accept = self._build_filter()
+
+    @property
+    def watched_repos(self) -> FrozenSet[str]:
+        """Repos to watch. If empty, watch all."""
+        return self._watched_repos
+
+    @watched_repos.setter
+    def watched_repos(self, value: Optional[Iterable[str]]) -> None:
+        self._watched_repos = frozenset(value or ())
+        self._accept = self._build_filter()
 
     def add(self, notification: Notification) -> bool:
         """Add a notification.
@@ -47,18 +78,14 @@ class NotificationManager:
         Returns:
             True if should be shown, False if filtered
         """
-        # Check DND mode
-        if self.dnd_mode and notification.priority != NotificationPriority.CRITICAL:
-            logger.debug(f"Notification suppressed (DND mode): {notification.title}")
-            return False
-        
-        # Check watched repos
-        if self.watched_repos and notification.repo and notification.repo not in self.watched_repos:
-            logger.debug(f"Notification filtered (repo not watched): {notification.title}")
+        if not self._accept(notification):
             return False
         
         self.notifications.append(notification)
-        logger.info(f"Notification added: {notification.title}")
+        self._by_priority[notification.priority.value].append(notification)
+        if notification.repo is not None:
+            self._by_repo.setdefault(notification.repo, []).append(notification)
+        logger.info("Notification added: %s", notification.title)
         return True
 
     def batch_summary(self) -> Optional[str]:
@@ -70,31 +97,54 @@ class NotificationManager:
         if not self.notifications:
             return None
         
-        # Group by priority
-        by_priority: Dict[str, List[Notification]] = {}
-        for notif in self.notifications:
-            priority = notif.priority.value
-            if priority not in by_priority:
-                by_priority[priority] = []
-            by_priority[priority].append(notif)
-        
         summary = []
         for priority in ["critical", "high", "normal", "low"]:
-            if priority in by_priority:
-                count = len(by_priority[priority])
+            count = len(self._by_priority[priority])
+            if count:
                 summary.append(f"{count} {priority} notification(s)")
         
         return ", ".join(summary)
 
     def get_by_priority(self, priority: NotificationPriority) -> List[Notification]:
         """Get notifications by priority."""
-        return [n for n in self.notifications if n.priority == priority]
+        return list(self._by_priority[NotificationPriority(priority).value])
 
     def get_by_repo(self, repo: str) -> List[Notification]:
         """Get notifications for a specific repo."""
-        return [n for n in self.notifications if n.repo == repo]
+        return list(self._by_repo.get(repo, []))
+
+    def _build_filter(self) -> Callable[[Notification], bool]:
+        """Build an accept predicate specialized for the current settings.
+        
+        Settings rarely change, so checks that cannot fail are left out
+        of the predicate instead of being re-tested on every add().
+        """
+        dnd_mode = self._dnd_mode
+        watched_repos = self._watched_repos
+        
+        def in_dnd(notification: Notification) -> bool:
+            if notification.priority is not NotificationPriority.CRITICAL:
+                logger.debug("Notification suppressed (DND mode): %s", notification.title)
+                return False
+            return True
+        
+        def in_watched(notification: Notification) -> bool:
+            if notification.repo and notification.repo not in watched_repos:
+                logger.debug("Notification filtered (repo not watched): %s", notification.title)
+                return False
+            return True
+        
+        if dnd_mode and watched_repos:
+            return lambda n: in_dnd(n) and in_watched(n)
+        if dnd_mode:
+            return in_dnd
+        if watched_repos:
+            return in_watched
+        return lambda n: True
 
     def clear(self) -> None:
         """Clear all notifications."""
         self.notifications = []
+        self._by_priority = {p.value: [] for p in NotificationPriority}
+        self._by_repo = {}
         logger.info("Notifications cleared")
@@ -1,10 +1,15 @@
 """Pomodoro timer with break reminders and hyperfocus mode."""
 
+import asyncio
+import math
+import random
+import time
 from datetime import datetime
-from typing import Optional, Callable
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Callable, Tuple
 
 from gh_wizard.utils.logger import setup_logger
-from gh_wizard.utils.config import Config
+from gh_wizard.utils.config import Config, get_config
 import os
 
 logger = setup_logger(__name__)
@@ -31,6 +36,7 @@ class PomodoroSession:
         short_break_minutes: int = 5,
         long_break_minutes: int = 15,
         sessions_until_long_break: int = 4,
+        clock: Optional[Callable[[], float]] = None,
     ):
         """Initialize Pomodoro session.
         
@@ -39,6 +45,8 @@ class PomodoroSession:
             short_break_minutes: Duration of short break
             long_break_minutes: Duration of long break
             sessions_until_long_break: How many work sessions before long break
+            clock: Time source returning monotonic seconds, used for all
+                of the session's timing. Defaults to time.monotonic.
         """
         self.work_minutes = work_minutes
         self.short_break_minutes = short_break_minutes
@@ -54,12 +62,20 @@ class PomodoroSession:
         self.start_time: Optional[datetime] = None
         self.paused_time: Optional[datetime] = None
         self.pause_offset: float = 0.0  # Track paused duration
+        # Timing uses monotonic seconds; the datetimes above are for display
+        self._start_monotonic: Optional[float] = None
+        self._pause_monotonic: Optional[float] = None
+        # Monotonic time the phase ends at, before adding pause_offset
+        self._phase_end: Optional[float] = None
+        self._now: Callable[[], float] = clock or time.monotonic
 
     def start(self) -> None:
         """Start the Pomodoro session."""
         self.is_running = True
         self.is_paused = False
         self.start_time = datetime.now()
+        self._start_monotonic = self._now()
+        self._phase_end = self._start_monotonic + self.total_time
         logger.info("Pomodoro session started: %s min work", self.work_minutes)
 
     def pause(self) -> None:
@@ -67,15 +83,16 @@ class PomodoroSession:
         if self.is_running and not self.is_paused:
             self.is_paused = True
             self.paused_time = datetime.now()
+            self._pause_monotonic = self._now()
             logger.info("Pomodoro session paused")
 
     def resume(self) -> None:
         """Resume the Pomodoro session."""
-        if self.is_paused and self.paused_time:
-            pause_duration = (datetime.now() - self.paused_time).total_seconds()
-            self.pause_offset += pause_duration
+        if self.is_paused and self._pause_monotonic is not None:
+            self.pause_offset += self._now() - self._pause_monotonic
             self.is_paused = False
             self.paused_time = None
+            self._pause_monotonic = None
             logger.info("Pomodoro session resumed")
 
     def stop(self) -> None:
@@ -84,19 +101,26 @@ class PomodoroSession:
         self.is_paused = False
         logger.info("Pomodoro session stopped")
 
+    def _phase_now(self) -> float:
+        """Get the time the phase has run up to; it stands still while paused."""
+        if self.is_paused and self._pause_monotonic is not None:
+            return self._pause_monotonic
+        return self._now()
+
     def get_elapsed_seconds(self) -> int:
         """Get elapsed seconds since session started."""
-        if not self.start_time:
+        if self._start_monotonic is None:
             return 0
         
-        elapsed = (datetime.now() - self.start_time).total_seconds() - self.pause_offset
-        return max(0, int(elapsed))
+        return int(max(0.0, self._phase_now() - self._start_monotonic - self.pause_offset))
 
     def get_remaining_seconds(self) -> int:
         """Get remaining seconds in current phase."""
-        elapsed = self.get_elapsed_seconds()
-        remaining = self.total_time - elapsed
-        return max(0, remaining)
+        if self._phase_end is None:
+            return self.total_time
+        
+        remaining = math.ceil(self._phase_end + self.pause_offset - self._phase_now())
+        return max(0, min(self.total_time, remaining))
 
     def get_progress_percentage(self) -> float:
         """Get progress as percentage (0-100)."""
@@ -105,9 +129,46 @@ class PomodoroSession:
         elapsed = self.get_elapsed_seconds()
         return min(100, (elapsed / self.total_time) * 100)
 
+    def seconds_to_next_tick(self) -> float:
+        """Get seconds until the remaining time next drops by a whole second."""
+        if self._start_monotonic is None:
+            return 1.0
+        
+        elapsed = self._phase_now() - self._start_monotonic - self.pause_offset
+        return 1.0 - (elapsed % 1.0)
+
+    def sleep_until_next_second(self) -> None:
+        """Block until the remaining time next drops by a whole second."""
+        time.sleep(max(0.0, self.seconds_to_next_tick()))
+
+    async def run(
+        self,
+        on_tick: Callable[["PomodoroSession"], Any],
+        on_phase_complete: Optional[Callable[["PomodoroSession"], Any]] = None,
+    ) -> None:
+        """Drive the current phase, waking once per displayed second.
+        
+        Args:
+            on_tick: Called with the session on every tick while running
+            on_phase_complete: Called once when the phase runs out
+        """
+        while self.is_running:
+            if self.is_paused:
+                await asyncio.sleep(1.0)
+                continue
+            
+            on_tick(self)
+            if self.is_phase_complete():
+                if on_phase_complete:
+                    on_phase_complete(self)
+                return
+            await asyncio.sleep(max(0.0, self.seconds_to_next_tick()))
+
     def is_phase_complete(self) -> bool:
         """Check if current phase is complete."""
-        return self.get_remaining_seconds() <= 0
+        if self._phase_end is None:
+            return self.total_time <= 0
+        return self._phase_now() >= self._phase_end + self.pause_offset
 
     def format_time(self, seconds: Optional[int] = None) -> str:
         """Format seconds as MM:SS."""
@@ -138,6 +199,8 @@ class PomodoroSession:
             logger.info("Starting work session: %s min", self.work_minutes)
             
         self.start_time = datetime.now()
+        self._start_monotonic = self._now()
+        self._phase_end = self._start_monotonic + self.total_time
         self.pause_offset = 0
         self.is_running = True
         self.is_paused = False
@@ -146,6 +209,38 @@ class PomodoroSession:
 class BreakReminder:
     """Intelligent break reminders with system activity awareness."""
 
+    # Suggestions categorized by intensity/duration
+    _SUGGESTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        "short": (
+            "Stretch your arms and neck 🧘",
+            "Look 20 feet away for 20 seconds 👀",
+            "Take 3 deep breaths 🌬️",
+            "Hydrate! Drink some water 💧",
+            "Stand up and shake it out 💃",
+        ),
+        "medium": (
+            "Walk around the room 🚶",
+            "Do 10 jumping jacks 🏃",
+            "Refill your water bottle 🚰",
+            "Clear your desk clutter 🧹",
+            "Check the weather outside 🌤️",
+        ),
+        "long": (
+            "Go for a short walk outside 🌳",
+            "Eat a healthy snack 🍎",
+            "Do a quick meditation session 🧘‍♂️",
+            "Call a friend or family member 📞",
+            "Listen to your favorite song 🎵",
+        ),
+    })
+
+    # Category by session_count % 4: long every 4th break, medium every
+    # other break, quick suggestions for standard breaks
+    _CAT_BY_SESSION = ("long", "short", "medium", "short")
+
+    # Labels for the suggestion categories
+    _CAT_LABEL = {"short": "Short Break", "medium": "Medium Break", "long": "Long Break"}
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -154,38 +249,17 @@ class BreakReminder:
         """Initialize break reminder.
         
         Args:
-            config: Config manager instance
+            config: Config manager instance. Defaults to the shared one
             reminder_callback: Callable when break should be taken
         """
-        self.config = config or Config()
+        self.config = config or get_config()
         self.reminder_callback = reminder_callback
         self.last_activity_time = datetime.now()
         self.idle_threshold = 3600  # 1 hour in seconds
+        self._rng = random.Random()
         
-        # Suggestions categorized by intensity/duration
-        self.suggestions = {
-            "short": [
-                "Stretch your arms and neck 🧘",
-                "Look 20 feet away for 20 seconds 👀",
-                "Take 3 deep breaths 🌬️",
-                "Hydrate! Drink some water 💧",
-                "Stand up and shake it out 💃",
-            ],
-            "medium": [
-                "Walk around the room 🚶",
-                "Do 10 jumping jacks 🏃",
-                "Refill your water bottle 🚰",
-                "Clear your desk clutter 🧹",
-                "Check the weather outside 🌤️",
-            ],
-            "long": [
-                "Go for a short walk outside 🌳",
-                "Eat a healthy snack 🍎",
-                "Do a quick meditation session 🧘‍♂️",
-                "Call a friend or family member 📞",
-                "Listen to your favorite song 🎵",
-            ]
-        }
+        # Shared, immutable suggestion table
+        self.suggestions = self._SUGGESTIONS
 
     def should_take_break(self, session: PomodoroSession) -> bool:
         """Determine if a break should be suggested."""
@@ -205,20 +279,10 @@ class BreakReminder:
         Args:
             session_count: Number of completed sessions
         """
-        import random
-        
-        if session_count % 4 == 0:
-            # Long break suggestions
-            category = "long"
-        elif session_count % 2 == 0:
-            # Medium intensity for every other break
-            category = "medium"
-        else:
-            # Quick suggestions for standard breaks
-            category = "short"
-            
-        suggestion = random.choice(self.suggestions[category])
-        return f"({category.title()} Break) {suggestion}"
+        category = self._CAT_BY_SESSION[session_count & 3]
+        suggestions = self.suggestions[category]
+        suggestion = suggestions[self._rng.randrange(len(suggestions))]
+        return f"({self._CAT_LABEL[category]}) {suggestion}"
 
     def trigger_reminder(self, session: PomodoroSession) -> None:
         """Trigger break reminder."""
@@ -1,26 +1,27 @@
 """Eisenhower Matrix for task prioritization."""
 
-from typing import List, Dict
-from enum import Enum
-import json
+from typing import List, Dict, Iterator, Optional, Tuple
+from bisect import insort
+from dataclasses import dataclass
+from enum import Enum, IntEnum
 from pathlib import Path
 from pydantic import BaseModel
 from rich.table import Table
 from rich.panel import Panel
-from rich.console import Console
 
+from gh_wizard.ui._console import console
+from gh_wizard.utils.fileio import atomic_write_bytes
 from gh_wizard.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-console = Console()
 
 
-class Priority(str, Enum):
-    """Task priority levels."""
-    CRITICAL = "critical"  # Urgent + Important
-    HIGH = "high"  # Important, not urgent
-    NORMAL = "normal"  # Urgent, not important
-    LOW = "low"  # Neither urgent nor important
+class Priority(IntEnum):
+    """Task priority levels, valued in sort order (most pressing first)."""
+    CRITICAL = 0  # Urgent + Important
+    HIGH = 1  # Important, not urgent
+    NORMAL = 2  # Urgent, not important
+    LOW = 3  # Neither urgent nor important
 
 
 class Quadrant(str, Enum):
@@ -31,8 +32,36 @@ class Quadrant(str, Enum):
     Q4 = "q4"  # Not Urgent & Not Important - ELIMINATE
 
 
-class Task(BaseModel):
-    """Task with priority matrix information."""
+# Indexed by (is_important << 1) | is_urgent
+_QUADRANT_LUT = (Quadrant.Q4, Quadrant.Q3, Quadrant.Q2, Quadrant.Q1)
+_PRIORITY_LUT = (Priority.LOW, Priority.NORMAL, Priority.HIGH, Priority.CRITICAL)
+# Indexed by Priority; each priority belongs to exactly one quadrant
+_QUADRANT_BY_PRIORITY = (Quadrant.Q1, Quadrant.Q2, Quadrant.Q3, Quadrant.Q4)
+
+# Color-coded priority labels for the task list
+_PRIORITY_MARKUP: Dict[Priority, str] = {
+    Priority.CRITICAL: "[red]critical[/red]",
+    Priority.HIGH: "[green]high[/green]",
+    Priority.NORMAL: "[yellow]normal[/yellow]",
+    Priority.LOW: "low",
+}
+
+# Matrix quadrant panels: (quadrant, title, color), in grid order
+_QUADRANT_PANELS = (
+    (Quadrant.Q1, "DO FIRST (Urgent & Important)", "red"),
+    (Quadrant.Q2, "SCHEDULE (Not Urgent & Important)", "blue"),
+    (Quadrant.Q3, "DELEGATE (Urgent & Not Important)", "yellow"),
+    (Quadrant.Q4, "ELIMINATE (Not Urgent & Not Important)", "green"),
+)
+
+
+@dataclass
+class Task:
+    """Task with priority matrix information.
+    
+    A plain dataclass, so it is cheap to build and read; data from outside
+    the program is validated by _MatrixFile when the matrix is loaded.
+    """
     id: str
     title: str
     description: str = ""
@@ -49,14 +78,7 @@ class Task(BaseModel):
         Returns:
             Quadrant enum value
         """
-        if self.is_urgent and self.is_important:
-            return Quadrant.Q1
-        elif not self.is_urgent and self.is_important:
-            return Quadrant.Q2
-        elif self.is_urgent and not self.is_important:
-            return Quadrant.Q3
-        else:
-            return Quadrant.Q4
+        return _QUADRANT_LUT[(self.is_important << 1) | self.is_urgent]
 
     def get_priority(self) -> Priority:
         """Get priority level.
@@ -64,15 +86,12 @@ class Task(BaseModel):
         Returns:
             Priority enum value
         """
-        quadrant = self.get_quadrant()
-        if quadrant == Quadrant.Q1:
-            return Priority.CRITICAL
-        elif quadrant == Quadrant.Q2:
-            return Priority.HIGH
-        elif quadrant == Quadrant.Q3:
-            return Priority.NORMAL
-        else:
-            return Priority.LOW
+        return _PRIORITY_LUT[(self.is_important << 1) | self.is_urgent]
+
+
+class _MatrixFile(BaseModel):
+    """On-disk layout of the matrix file, validated on load."""
+    tasks: Dict[str, Task] = {}
 
 
 class EisenhowerMatrix:
@@ -81,12 +100,24 @@ class EisenhowerMatrix:
     def __init__(self):
         """Initialize Eisenhower Matrix."""
         self.tasks: Dict[str, Task] = {}
-        self.quadrants: Dict[Quadrant, List[str]] = {
-            Quadrant.Q1: [],
-            Quadrant.Q2: [],
-            Quadrant.Q3: [],
-            Quadrant.Q4: [],
+        # Task ids per quadrant; dicts are insertion-ordered sets, so
+        # removal is O(1) while rendering keeps the order tasks were added
+        self.quadrants: Dict[Quadrant, Dict[str, None]] = {
+            Quadrant.Q1: {},
+            Quadrant.Q2: {},
+            Quadrant.Q3: {},
+            Quadrant.Q4: {},
         }
+        # (priority, insertion order, task id), kept sorted on add
+        self._priority_sorted: List[Tuple[Priority, int, str]] = []
+        self._insert_count = 0
+        # Rendered matrix layout, built on first render and reused after
+        self._panels: Dict[Quadrant, Panel] = {}
+        self._matrix_panel: Optional[Panel] = None
+        # Bumped on every change to the tasks; panel contents are rebuilt
+        # only when it differs from the version last rendered
+        self._version = 0
+        self._rendered_version = -1
 
     def add_task(self, task: Task) -> None:
         """Add task to matrix.
@@ -94,23 +125,39 @@ class EisenhowerMatrix:
         Args:
             task: Task to add
         """
+        if task.id in self.tasks:
+            self._unfile(task.id)
         self.tasks[task.id] = task
+        insort(self._priority_sorted, (task.get_priority(), self._insert_count, task.id))
+        self._insert_count += 1
+        self._version += 1
         quadrant = task.get_quadrant()
-        self.quadrants[quadrant].append(task.id)
+        self.quadrants[quadrant][task.id] = None
         logger.info("Task added to %s: %s", quadrant.value, task.title)
 
     def get_quadrant_tasks(self, quadrant: Quadrant) -> List[Task]:
         """Get all tasks in a specific quadrant."""
-        task_ids = self.quadrants.get(quadrant, [])
-        return [self.tasks[tid] for tid in task_ids if tid in self.tasks]
+        # quadrants only ever holds ids present in tasks, so no membership check
+        tasks = self.tasks
+        return [tasks[tid] for tid in self.quadrants[quadrant]]
+
+    def _unfile(self, task_id: str) -> None:
+        """Remove a task id from both the priority index and its quadrant.
+        
+        The quadrant is found from the priority the task was filed under,
+        which stays correct even if the task's flags changed since.
+        """
+        for i, (priority, _, tid) in enumerate(self._priority_sorted):
+            if tid == task_id:
+                del self._priority_sorted[i]
+                del self.quadrants[_QUADRANT_BY_PRIORITY[priority]][task_id]
+                return
 
     def save(self, filepath: str = "eisenhower_matrix.json") -> None:
         """Save tasks to JSON file."""
-        data = {
-            "tasks": {tid: task.model_dump() for tid, task in self.tasks.items()}
-        }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Serialized straight from the models, without an intermediate dict per task
+        data = _MatrixFile.model_construct(tasks=self.tasks)
+        atomic_write_bytes(Path(filepath), data.model_dump_json(indent=2).encode("utf-8"))
         logger.info("Matrix saved to %s", filepath)
 
     def load(self, filepath: str = "eisenhower_matrix.json") -> None:
@@ -120,63 +167,88 @@ class EisenhowerMatrix:
             return
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Parsed and validated into Task models in one pydantic-core pass
+            data = _MatrixFile.model_validate_json(path.read_bytes())
+            
+            tasks = {task.id: task for task in data.tasks.values()}
+            quadrants: Dict[Quadrant, Dict[str, None]] = {q: {} for q in Quadrant}
             
-            self.tasks = {}
-            self.quadrants = {q: [] for q in Quadrant}
+            # Index in one pass instead of add_task() per entry
+            priority_sorted = []
+            for i, task in enumerate(tasks.values()):
+                quadrants[task.get_quadrant()][task.id] = None
+                priority_sorted.append((task.get_priority(), i, task.id))
+            priority_sorted.sort()
             
-            for _, task_data in data.get("tasks", {}).items():
-                task = Task(**task_data)
-                self.add_task(task)
+            self.tasks = tasks
+            self.quadrants = quadrants
+            self._priority_sorted = priority_sorted
+            self._insert_count = len(priority_sorted)
+            self._version += 1
             
-            logger.info("Matrix loaded from %s", filepath)
+            logger.info("Matrix loaded from %s: %s tasks", filepath, len(tasks))
         except Exception as e:
             logger.error("Error loading matrix: %s", e)
 
     def get_priority_tasks(self) -> List[Task]:
         """Get all tasks sorted by priority."""
-        all_tasks = list(self.tasks.values())
-        priority_order = {Priority.CRITICAL: 0, Priority.HIGH: 1, Priority.NORMAL: 2, Priority.LOW: 3}
-        all_tasks.sort(key=lambda t: priority_order[t.get_priority()])
-        return [t for t in all_tasks if not t.completed]
+        return [task for _, task in self._live_sorted()]
+
+    def _live_sorted(self) -> Iterator[Tuple[Priority, Task]]:
+        """Yield (priority, task) for incomplete tasks in priority order.
+        
+        The priority comes from the index, so callers don't recompute it.
+        """
+        tasks = self.tasks
+        for priority, _, tid in self._priority_sorted:
+            task = tasks[tid]
+            if not task.completed:
+                yield priority, task
 
     def mark_complete(self, task_id: str) -> None:
         """Mark task as complete."""
         if task_id in self.tasks:
             self.tasks[task_id].completed = True
+            self._version += 1
             # We don't remove from quadrants, just mark as complete
             logger.info("Task completed: %s", task_id)
 
     def render_matrix(self) -> None:
         """Render the Eisenhower Matrix to the console."""
-        # Create a 2x2 grid using tables
+        if self._matrix_panel is None:
+            self._matrix_panel = self._build_matrix_panel()
         
-        def create_quadrant_panel(quadrant: Quadrant, title: str, color: str) -> Panel:
-            tasks = self.get_quadrant_tasks(quadrant)
-            content = ""
-            for task in tasks:
-                status = "✅" if task.completed else "☐"
-                content += f"{status} {task.title}\n"
-            if not content:
-                content = "[dim]No tasks[/dim]"
-            
-            return Panel(content, title=f"[{color}]{title}[/{color}]", border_style=color)
-
-        q1 = create_quadrant_panel(Quadrant.Q1, "DO FIRST (Urgent & Important)", "red")
-        q2 = create_quadrant_panel(Quadrant.Q2, "SCHEDULE (Not Urgent & Important)", "blue")
-        q3 = create_quadrant_panel(Quadrant.Q3, "DELEGATE (Urgent & Not Important)", "yellow")
-        q4 = create_quadrant_panel(Quadrant.Q4, "ELIMINATE (Not Urgent & Not Important)", "green")
+        # Only the panel contents change between renders, and only when
+        # the tasks have changed since the last one
+        if self._rendered_version != self._version:
+            tasks = self.tasks
+            for quadrant, panel in self._panels.items():
+                lines = [
+                    f"{'✅' if tasks[tid].completed else '☐'} {tasks[tid].title}"
+                    for tid in self.quadrants[quadrant]
+                ]
+                panel.renderable = "\n".join(lines) if lines else "[dim]No tasks[/dim]"
+            self._rendered_version = self._version
+        
+        console.print(self._matrix_panel)
 
+    def _build_matrix_panel(self) -> Panel:
+        """Build the 2x2 quadrant grid and the panel around it."""
+        for quadrant, title, color in _QUADRANT_PANELS:
+            self._panels[quadrant] = Panel(
+                "", title=f"[{color}]{title}[/{color}]", border_style=color
+            )
+        
         # Create a main table to hold the quadrants
         grid = Table.grid(expand=True, padding=1)
         grid.add_column(ratio=1)
         grid.add_column(ratio=1)
         
-        grid.add_row(q1, q2)
-        grid.add_row(q3, q4)
+        panels = self._panels
+        grid.add_row(panels[Quadrant.Q1], panels[Quadrant.Q2])
+        grid.add_row(panels[Quadrant.Q3], panels[Quadrant.Q4])
         
-        console.print(Panel(grid, title="⚡ Eisenhower Matrix", border_style="bold white"))
+        return Panel(grid, title="⚡ Eisenhower Matrix", border_style="bold white")
 
     def render_priority_list(self) -> Table:
         """Render priority-sorted task list."""
@@ -186,24 +258,12 @@ class EisenhowerMatrix:
         table.add_column("Time (min)", justify="right")
         table.add_column("Quadrant")
         
-        for task in self.get_priority_tasks():
-            priority = task.get_priority()
-            quadrant = task.get_quadrant()
-            
-            # Color code by priority
-            priority_str = priority.value
-            if priority == Priority.CRITICAL:
-                priority_str = f"[red]{priority_str}[/red]"
-            elif priority == Priority.HIGH:
-                priority_str = f"[green]{priority_str}[/green]"
-            elif priority == Priority.NORMAL:
-                priority_str = f"[yellow]{priority_str}[/yellow]"
-            
+        for priority, task in self._live_sorted():
             table.add_row(
-                priority_str,
+                _PRIORITY_MARKUP[priority],
                 task.title,
                 str(task.estimated_time),
-                quadrant.value,
+                _QUADRANT_BY_PRIORITY[priority].value,
             )
         
         return table
@@ -11,7 +11,6 @@ from rich.progress import (
     TimeElapsedColumn,
     MofNCompleteColumn,
 )
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.live import Live
@@ -21,7 +20,6 @@ from gh_wizard.pomodoro import PomodoroSession
 from gh_wizard.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-console = Console()
 
 
 class ProgressDisplay:
@@ -49,6 +47,8 @@ class ProgressDisplay:
         """
         remaining = session.format_time()
         progress = session.get_progress_percentage()
+        phase = session.current_phase
+        is_work = phase == "work"
         
         # Create progress bar manually
         bar_width = 40
@@ -56,20 +56,16 @@ class ProgressDisplay:
         bar = "█" * filled + "░" * (bar_width - filled)
         
         # Determine color based on phase
-        color = "green" if session.current_phase == "work" else "blue"
-        phase_emoji = "💼" if session.current_phase == "work" else "☕"
+        color = "green" if is_work else "blue"
+        phase_emoji = "💼" if is_work else "☕"
         
         task_info = f"[bold cyan]Task: {task_title}[/bold cyan]\n" if task_title else ""
         
-        content = f"""
-{phase_emoji} {session.current_phase.upper()}
-{task_info}
-[bold {color}]{remaining}[/bold {color}]
-{bar}
-{progress:.1f}%
-
-[dim]Sessions completed: {session.completed_sessions}[/dim]
-"""
+        content = (
+            f"\n{phase_emoji} {phase.upper()}\n{task_info}\n"
+            f"[bold {color}]{remaining}[/bold {color}]\n{bar}\n{progress:.1f}%\n\n"
+            f"[dim]Sessions completed: {session.completed_sessions}[/dim]\n"
+        )
         
         return Panel(
             content,
@@ -140,6 +136,9 @@ class MultiTaskProgress:
     def __init__(self):
         """Initialize multi-task progress tracker."""
         self.tasks: Dict[str, Dict[str, Any]] = {}
+        # Step totals across all tasks, kept current by add/update
+        self._total_steps = 0
+        self._completed_steps = 0
 
     def add_task(
         self,
@@ -156,6 +155,12 @@ class MultiTaskProgress:
             total_steps: Total number of steps
             description: Optional description
         """
+        previous = self.tasks.get(task_id)
+        if previous is not None:
+            self._total_steps -= previous["total_steps"]
+            self._completed_steps -= previous["completed_steps"]
+        
+        self._total_steps += total_steps
         self.tasks[task_id] = {
             "name": name,
             "description": description,
@@ -172,18 +177,15 @@ class MultiTaskProgress:
             task_id: Task identifier
             steps_completed: Number of steps completed
         """
-        if task_id in self.tasks:
-            self.tasks[task_id]["completed_steps"] = min(
-                steps_completed,
-                self.tasks[task_id]["total_steps"],
-            )
+        task = self.tasks.get(task_id)
+        if task is not None:
+            completed = min(steps_completed, task["total_steps"])
+            self._completed_steps += completed - task["completed_steps"]
+            task["completed_steps"] = completed
             
             # Check if complete
-            if (
-                self.tasks[task_id]["completed_steps"]
-                >= self.tasks[task_id]["total_steps"]
-            ):
-                self.tasks[task_id]["status"] = "complete"
+            if completed >= task["total_steps"]:
+                task["status"] = "complete"
                 logger.info("Task completed: %s", task_id)
 
     def get_overall_progress(self) -> float:
@@ -192,16 +194,10 @@ class MultiTaskProgress:
         Returns:
             Overall completion percentage (0-100)
         """
-        if not self.tasks:
-            return 0.0
-        
-        total_steps = float(sum(t["total_steps"] for t in self.tasks.values()))
-        completed_steps = float(sum(t["completed_steps"] for t in self.tasks.values()))
-        
-        if total_steps == 0:
+        if self._total_steps == 0:
             return 0.0
         
-        return (completed_steps / total_steps) * 100.0
+        return (self._completed_steps / self._total_steps) * 100.0
 
     def render_overview(self) -> Table:
         """Render overview of all tasks.
@@ -1,36 +1,55 @@
 """Session management for hyperfocus mode."""
 
-import json
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import ClassVar, Optional, Dict, Any, List, Set
 import uuid
 
+import orjson
+
+from gh_wizard.utils.fileio import atomic_write_bytes
 from gh_wizard.utils.logger import setup_logger
+from gh_wizard.utils.paths import BASE_DIR
+from gh_wizard.utils.throttle import ThrottledSaver
 
 logger = setup_logger(__name__)
 
+# Reading session files is I/O bound, so list_sessions reads them in parallel
+LIST_WORKERS = 8
+
+# Minimum seconds between batched writes of context and breadcrumb updates
+SAVE_INTERVAL = 2.0
+
 
 class SessionManager:
     """Manage hyperfocus sessions and context preservation."""
 
+    # Session directories already created by this process
+    _initialized_dirs: ClassVar[Set[Path]] = set()
+
     def __init__(self, config_dir: Optional[str] = None):
         """Initialize session manager.
         
         Args:
-            config_dir: Directory for session storage. Defaults to ~/.ghwizard
+            config_dir: Directory for session storage. Defaults to BASE_DIR
         """
         if config_dir is None:
-            config_dir = os.path.expanduser("~/.ghwizard")
+            config_dir = str(BASE_DIR)
         
         self.config_dir = Path(config_dir)
         self.sessions_dir = self.config_dir / "sessions"
         self.current_session_file = self.config_dir / "current_session.json"
         
         # Create directories if they don't exist
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        if self.sessions_dir not in SessionManager._initialized_dirs:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self.sessions_dir.mkdir(parents=True, exist_ok=True)
+            SessionManager._initialized_dirs.add(self.sessions_dir)
+        
+        # Sessions changed by update_context/add_breadcrumb but not yet written
+        self._dirty_sessions: Dict[str, Dict[str, Any]] = {}
+        self._saver = ThrottledSaver(self._write_dirty_sessions, SAVE_INTERVAL)
 
     def start(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Start a new hyperfocus session.
@@ -56,9 +75,7 @@ class SessionManager:
         }
         
         # Save session
-        session_file = self.sessions_dir / f"{session_id}.json"
-        with open(session_file, "w") as f:
-            json.dump(session, f, indent=2)
+        self._save_session(session_id, session)
         
         # Set as current
         self._set_current_session(session_id)
@@ -106,31 +123,26 @@ class SessionManager:
 
     def get_last_session(self) -> Optional[Dict[str, Any]]:
         """Get the most recently modified session."""
-        sessions: List[Dict[str, Any]] = []
-        for session_file in self.sessions_dir.glob("*.json"):
-            try:
-                with open(session_file) as f:
-                    session = json.load(f)
-                    sessions.append(session)
-            except Exception as e:
-                logger.warning(f"Failed to load session {session_file}: {e}")
-        
-        if sessions:
-            # Sort by last_active
-            sessions.sort(key=lambda x: x.get("last_active", ""), reverse=True)
-            return sessions[0]
+        self.flush()
+        # Every save rewrites the file, so mtime orders sessions without parsing them
+        session_files = sorted(
+            self.sessions_dir.glob("*.json"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for session_file in session_files:
+            session = self._read_session_file(session_file)
+            if session is not None:
+                return session
         return None
 
     def list_sessions(self) -> List[Dict[str, Any]]:
         """List all sessions."""
-        sessions = []
-        for session_file in self.sessions_dir.glob("*.json"):
-            try:
-                with open(session_file) as f:
-                    session = json.load(f)
-                    sessions.append(session)
-            except Exception as e:
-                logger.warning(f"Failed to load session {session_file}: {e}")
+        self.flush()
+        session_files = list(self.sessions_dir.glob("*.json"))
+        with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+            loaded = executor.map(self._read_session_file, session_files)
+            sessions = [session for session in loaded if session is not None]
         
         # Sort by last_active
         sessions.sort(key=lambda x: x.get("last_active", ""), reverse=True)
@@ -153,7 +165,7 @@ class SessionManager:
         if context:
             session["context"].update(context)
         session["last_active"] = datetime.now().isoformat()
-        self._save_session(session_id, session)
+        self._mark_dirty(session_id, session)
 
     def add_breadcrumb(self, message: str, session_id: Optional[str] = None) -> None:
         """Add a breadcrumb (navigation trace) to session.
@@ -173,34 +185,64 @@ class SessionManager:
             "timestamp": datetime.now().isoformat(),
             "message": message,
         })
-        self._save_session(session_id, session)
+        self._mark_dirty(session_id, session)
+
+    def flush(self) -> None:
+        """Write all pending session changes to disk now."""
+        self._saver.flush()
 
     # Private methods
+    def _write_dirty_sessions(self) -> None:
+        """Write the sessions changed since the last save."""
+        while self._dirty_sessions:
+            session_id, session = self._dirty_sessions.popitem()
+            try:
+                self._save_session(session_id, session)
+            except Exception as e:
+                logger.error(f"Failed to save session {session_id}: {e}")
+
     def _load_session(self, session_id: str) -> Dict[str, Any]:
-        """Load session from disk."""
+        """Load session, including changes not yet written to disk."""
+        pending = self._dirty_sessions.get(session_id)
+        if pending is not None:
+            return pending
         session_file = self.sessions_dir / f"{session_id}.json"
-        with open(session_file) as f:
-            result: Dict[str, Any] = json.load(f)
+        result: Dict[str, Any] = orjson.loads(session_file.read_bytes())
+        return result
+
+    def _read_session_file(self, session_file: Path) -> Optional[Dict[str, Any]]:
+        """Read a session file, or None if it can't be parsed."""
+        try:
+            result: Dict[str, Any] = orjson.loads(session_file.read_bytes())
             return result
+        except Exception as e:
+            logger.warning(f"Failed to load session {session_file}: {e}")
+            return None
 
     def _save_session(self, session_id: str, session: Dict[str, Any]) -> None:
         """Save session to disk."""
+        with self._saver.lock:
+            self._dirty_sessions.pop(session_id, None)
         session_file = self.sessions_dir / f"{session_id}.json"
-        with open(session_file, "w") as f:
-            json.dump(session, f, indent=2)
+        atomic_write_bytes(session_file, orjson.dumps(session, option=orjson.OPT_INDENT_2))
+
+    def _mark_dirty(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Queue a session write, at most once per SAVE_INTERVAL."""
+        with self._saver.lock:
+            self._dirty_sessions[session_id] = session
+            self._saver.mark_dirty()
 
     def _set_current_session(self, session_id: str) -> None:
         """Set current session ID."""
-        with open(self.current_session_file, "w") as f:
-            json.dump({"session_id": session_id}, f)
+        self.current_session_file.write_bytes(orjson.dumps({"session_id": session_id}))
 
     def _get_current_session_id(self) -> Optional[str]:
         """Get current session ID."""
         try:
-            if self.current_session_file.exists():
-                with open(self.current_session_file) as f:
-                    data: Dict[str, Any] = json.load(f)
-                    return data.get("session_id")
+            data: Dict[str, Any] = orjson.loads(self.current_session_file.read_bytes())
+            return data.get("session_id")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to get current session: {e}")
         return None
@@ -1,17 +1,25 @@
 """Statistics tracking for user sessions."""
 
-import json
-from datetime import datetime, date
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+import orjson
+from pydantic import TypeAdapter
 
+from gh_wizard.utils.fileio import atomic_write_bytes
 from gh_wizard.utils.logger import setup_logger
+from gh_wizard.utils.paths import BASE_DIR
+from gh_wizard.utils.throttle import ThrottledSaver
 
 logger = setup_logger(__name__)
 
+# Minimum seconds between stats file writes
+SAVE_INTERVAL = 2.0
 
-class DailyStats(BaseModel):
+
+@dataclass
+class DailyStats:
     """Stats for a single day."""
     date: str  # ISO format YYYY-MM-DD
     work_sessions: int = 0
@@ -21,6 +29,10 @@ class DailyStats(BaseModel):
     tasks_completed: int = 0
 
 
+# On-disk layout of the stats file: ISO date -> DailyStats, validated on load
+_STATS_FILE = TypeAdapter(Dict[str, DailyStats])
+
+
 class StatsManager:
     """Manage usage statistics."""
 
@@ -28,14 +40,16 @@ class StatsManager:
         """Initialize stats manager.
         
         Args:
-            stats_file: Path to stats file. Defaults to ~/.ghwizard/stats.json
+            stats_file: Path to stats file. Defaults to BASE_DIR/stats.json
         """
         if stats_file is None:
-            stats_file = Path.home() / ".ghwizard" / "stats.json"
+            stats_file = BASE_DIR / "stats.json"
         
         self.stats_file = stats_file
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
         self.stats = self._load_stats()
+        
+        self._saver = ThrottledSaver(self._write_stats, SAVE_INTERVAL)
 
     def _load_stats(self) -> Dict[str, DailyStats]:
         """Load stats from file."""
@@ -43,19 +57,29 @@ class StatsManager:
             return {}
         
         try:
-            with open(self.stats_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return {k: DailyStats(**v) for k, v in data.items()}
+            # Parsed and validated into DailyStats in one pydantic-core pass
+            return _STATS_FILE.validate_json(self.stats_file.read_bytes())
         except Exception as e:
             logger.error("Error loading stats: %s", e)
             return {}
 
     def save(self) -> None:
-        """Save stats to file."""
+        """Save stats to file, at most once per SAVE_INTERVAL.
+        
+        Changes made within the interval are written when it ends.
+        """
+        self._saver.mark_dirty()
+
+    def flush(self) -> None:
+        """Write pending stats to file now."""
+        self._saver.flush()
+
+    def _write_stats(self) -> None:
+        """Write the stats file."""
         try:
-            data = {k: v.model_dump() for k, v in self.stats.items()}
-            with open(self.stats_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # orjson serializes the dataclasses natively
+            payload = orjson.dumps(self.stats, option=orjson.OPT_INDENT_2)
+            atomic_write_bytes(self.stats_file, payload)
         except Exception as e:
             logger.error("Error saving stats: %s", e)
 
@@ -66,6 +90,17 @@ class StatsManager:
             self.stats[today] = DailyStats(date=today)
         return self.stats[today]
 
+    def sum_last_n_days(self, n: int, field: str = "work_minutes") -> int:
+        """Sum a stats field over the last n days, today included.
+        
+        Args:
+            n: Number of days to cover
+            field: DailyStats field to sum
+        """
+        # ISO dates sort chronologically, so the window is a string compare
+        cutoff = (date.today() - timedelta(days=n - 1)).isoformat()
+        return sum(getattr(day, field) for key, day in self.stats.items() if key >= cutoff)
+
     def record_work_session(self, minutes: int) -> None:
         """Record a completed work session."""
         stats = self.get_today_stats()
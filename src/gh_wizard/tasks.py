@@ -1,21 +1,23 @@
 """Task breakdown engine for complex workflows."""
 
+import re
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
-from pydantic import BaseModel
 
 from gh_wizard.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-class TaskStep(BaseModel):
+@dataclass
+class TaskStep:
     """Single task step."""
     name: str
     description: str
     time_estimate: int  # minutes
     priority: str = "normal"  # normal, high, critical
-    dependencies: List[str] = []
-    commands: List[str] = []
+    dependencies: List[str] = field(default_factory=list)
+    commands: List[str] = field(default_factory=list)
 
 
 class TaskBreakdown:
@@ -72,6 +74,28 @@ class TaskBreakdown:
         "optimize": "refactor",
     }
 
+    # Every term breakdown() looks for, in precedence order: keywords first,
+    # then the pattern names themselves
+    _TERMS = list(dict.fromkeys([*KEYWORD_MAPPING, *PATTERNS]))
+    _TERM_RANK = {term: rank for rank, term in enumerate(_TERMS)}
+    _TERM_PATTERN = {**{p: p for p in PATTERNS}, **KEYWORD_MAPPING}
+    # Lookahead so overlapping terms are all found in a single scan
+    _TERM_RE = re.compile("(?=(" + "|".join(map(re.escape, _TERMS)) + "))")
+
+    # Steps for each pattern, built once
+    _STEPS: Dict[str, List[Dict[str, Any]]] = {
+        name: [
+            {
+                "name": step["name"],
+                "description": step["desc"],
+                "time_estimate": step["time"],
+                "priority": "high" if name == "release" else "normal",
+            }
+            for step in steps
+        ]
+        for name, steps in PATTERNS.items()
+    }
+
     def breakdown(self, task: str) -> List[Dict[str, Any]]:
         """Break down a task into steps.
         
@@ -81,33 +105,14 @@ class TaskBreakdown:
         Returns:
             List of task steps
         """
-        # Simple pattern matching
-        task_lower = task.lower()
-        
-        # Check specific keywords first
-        matched_pattern = None
-        for keyword, pattern in self.KEYWORD_MAPPING.items():
-            if keyword in task_lower:
-                matched_pattern = pattern
-                break
-        
-        # Fallback to direct pattern matching if no keyword match
-        if not matched_pattern:
-            for pattern in self.PATTERNS:
-                if pattern in task_lower:
-                    matched_pattern = pattern
-                    break
+        # Simple pattern matching: the highest-precedence term found wins
+        matches = self._TERM_RE.findall(task.lower())
         
-        if matched_pattern:
-            steps = self.PATTERNS[matched_pattern]
-            result = []
-            for step in steps:
-                result.append({
-                    "name": step["name"],
-                    "description": step["desc"],
-                    "time_estimate": step["time"],
-                    "priority": "high" if matched_pattern == "release" else "normal",
-                })
+        if matches:
+            term = min(matches, key=self._TERM_RANK.__getitem__)
+            matched_pattern = self._TERM_PATTERN[term]
+            # Copies, so callers can't alter the cached steps
+            result = [dict(step) for step in self._STEPS[matched_pattern]]
             logger.info(f"Broke down task '{task}' using pattern: {matched_pattern}")
             return result
         
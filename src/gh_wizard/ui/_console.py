@@ -0,0 +1,7 @@
+"""Shared Rich console."""
+
+from rich.console import Console
+
+# One console for the whole process, so terminal detection runs once and
+# Live displays and progress bars all render through the same output
+console = Console()
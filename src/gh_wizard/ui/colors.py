@@ -1,9 +1,10 @@
 """Color schemes and theming."""
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
-COLOR_SCHEMES = {
+_SCHEMES: Dict[str, Dict[str, str]] = {
     "default": {
         "primary": "cyan",
         "success": "green",
@@ -31,6 +32,13 @@ COLOR_SCHEMES = {
 }
 
 
-def get_color_scheme(theme: str = "default") -> Dict[str, str]:
+# Read-only views, so the shared schemes can be handed out without copying
+COLOR_SCHEMES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {name: MappingProxyType(scheme) for name, scheme in _SCHEMES.items()}
+)
+_DEFAULT_SCHEME = COLOR_SCHEMES["default"]
+
+
+def get_color_scheme(theme: str = "default") -> Mapping[str, str]:
     """Get color scheme for theme."""
-    return COLOR_SCHEMES.get(theme, COLOR_SCHEMES["default"])
+    return COLOR_SCHEMES.get(theme) or _DEFAULT_SCHEME
@@ -1,50 +1,84 @@
 """Dashboard renderer."""
 
-from rich.console import Console
+import functools
+from typing import Any, Dict, Tuple
+
+from rich.console import JustifyMethod
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
-from gh_wizard.github_api import GitHubAPIClient
+from gh_wizard.github_api import GitHubAPIClient, MissingDataError
+from gh_wizard.ui._console import console
 from gh_wizard.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-console = Console()
+
+# Stands in for null or missing sub-objects of a repository node
+_EMPTY: Dict[str, Any] = {}
+
+# Repository table columns: (header, style, justify)
+_COLS: Tuple[Tuple[str, str, JustifyMethod], ...] = (
+    ("Repository", "cyan", "left"),
+    ("Issues", "yellow", "right"),
+    ("Pull Requests", "green", "right"),
+    ("Branch", "magenta", "left"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> GitHubAPIClient:
+    """Return the process-wide API client, creating it on first use.
+    
+    Reusing one client keeps its HTTP session, and the open connections to
+    the API, across dashboard refreshes. A missing token raises and is not
+    cached, so the next call tries again.
+    """
+    return GitHubAPIClient()
+
+
+def _reset_client() -> None:
+    """Drop the cached client, e.g. between tests or after a token change."""
+    _get_client.cache_clear()
+
+
+def _new_table() -> Table:
+    """Create an empty repository table."""
+    table = Table(title="📊 Your Repositories")
+    for header, style, justify in _COLS:
+        table.add_column(header, style=style, justify=justify)
+    return table
 
 
 def show_dashboard() -> None:
     """Display the main dashboard."""
     try:
-        client = GitHubAPIClient()
-        
-        # Get repos status
-        data = client.get_repos_status()
-        
-        if "viewer" not in data or "repositories" not in data["viewer"]:
-            console.print("[red]Failed to fetch repositories[/red]")
-            return
-        
-        repos = data["viewer"]["repositories"]["nodes"]
-        
-        # Create table
-        table = Table(title="📊 Your Repositories")
-        table.add_column("Repository", style="cyan")
-        table.add_column("Issues", justify="right", style="yellow")
-        table.add_column("Pull Requests", justify="right", style="green")
-        table.add_column("Branch", style="magenta")
+        client = _get_client()
         
-        for repo in repos:
-            issues = repo["issues"]["totalCount"]
-            prs = repo["pullRequests"]["totalCount"]
-            branch = repo["defaultBranchRef"]["name"] if repo["defaultBranchRef"] else "N/A"
-            
-            table.add_row(
-                repo["name"],
-                str(issues),
-                str(prs),
-                branch,
-            )
+        table = _new_table()
         
-        console.print(table)
+        # Rows are drawn as each repository arrives from the streamed response
+        repos = client.iter_repos_status()
+        try:
+            with Live(table, console=console, refresh_per_second=10):
+                add_row = table.add_row
+                for repo in repos:
+                    # defaultBranchRef is null for empty repositories
+                    branch_ref = repo.get("defaultBranchRef") or _EMPTY
+                    add_row(
+                        repo["name"],
+                        f"{(repo.get('issues') or _EMPTY).get('totalCount', 0)}",
+                        f"{(repo.get('pullRequests') or _EMPTY).get('totalCount', 0)}",
+                        branch_ref.get("name", "N/A"),
+                    )
+                
+                if not table.row_count:
+                    table.caption = "[dim]No repositories found[/dim]"
+        finally:
+            # Release the connection if rendering stopped partway
+            repos.close()
         
+    except MissingDataError:
+        console.print("[red]Failed to fetch repositories[/red]")
     except Exception as e:
         console.print(f"[red]Error loading dashboard: {e}[/red]")
         logger.error(f"Dashboard error: {e}")
@@ -1,9 +1,8 @@
 """Progress tracking UI components."""
 
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
-from rich.console import Console
 
-console = Console()
+from gh_wizard.ui._console import console
 
 
 def create_task_progress():
@@ -1,14 +1,23 @@
 """Configuration management."""
 
+import functools
 import os
-import json
+from collections import ChainMap
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import orjson
+
+from gh_wizard.utils.fileio import atomic_write_bytes
 from gh_wizard.utils.logger import setup_logger
+from gh_wizard.utils.paths import BASE_DIR
+from gh_wizard.utils.throttle import ThrottledSaver
 
 logger = setup_logger(__name__)
 
+# Minimum seconds between config file writes
+SAVE_INTERVAL = 0.5
+
 
 class Config:
     """Manage wizard configuration."""
@@ -26,14 +35,18 @@ class Config:
         """Initialize config manager.
         
         Args:
-            config_file: Path to config file. Defaults to ~/.ghwizard/config.json
+            config_file: Path to config file. Defaults to BASE_DIR/config.json
         """
         if config_file is None:
-            config_file = Path.home() / ".ghwizard" / "config.json"
+            # BASE_DIR is created when gh_wizard.utils.paths is imported
+            config_file = BASE_DIR / "config.json"
+        else:
+            config_file.parent.mkdir(parents=True, exist_ok=True)
         
         self.config_file = config_file
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
         self.config = self._load_config()
+        
+        self._saver = ThrottledSaver(self._save_config, SAVE_INTERVAL)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value."""
@@ -41,34 +54,53 @@ class Config:
 
     def set(self, key: str, value: Any) -> None:
         """Set config value."""
-        self.config[key] = value
-        self._save_config()
+        # Under the saver's lock, so a save never sees a half-applied change
+        with self._saver.lock:
+            self.config[key] = value
+            self._saver.mark_dirty()
         logger.debug(f"Config updated: {key} = {value}")
 
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple config values."""
-        self.config.update(updates)
-        self._save_config()
+        with self._saver.lock:
+            self.config.update(updates)
+            self._saver.mark_dirty()
         logger.debug(f"Config updated: {updates}")
 
+    def flush(self) -> None:
+        """Write pending config changes to file now."""
+        self._saver.flush()
+
     # Private methods
-    def _load_config(self) -> Dict[str, Any]:
-        """Load config from file."""
+
+    def _load_config(self) -> "ChainMap[str, Any]":
+        """Load config from file.
+        
+        Stored values are layered over the defaults instead of copied into
+        a merged dict; changes are written to the stored layer.
+        """
+        config: Dict[str, Any] = {}
         if self.config_file.exists():
             try:
-                with open(self.config_file) as f:
-                    config = json.load(f)
-                    # Merge with defaults
-                    return {**self.DEFAULT_CONFIG, **config}
+                loaded = orjson.loads(self.config_file.read_bytes())
+                if not isinstance(loaded, dict):
+                    raise ValueError("config file must hold a JSON object")
+                config = loaded
             except Exception as e:
                 logger.warning(f"Failed to load config: {e}")
         
-        return self.DEFAULT_CONFIG.copy()
+        return ChainMap(config, type(self).DEFAULT_CONFIG)
 
     def _save_config(self) -> None:
-        """Save config to file."""
+        """Save config to file; called by the saver with its lock held."""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=2)
+            payload = orjson.dumps(dict(self.config), option=orjson.OPT_INDENT_2)
+            atomic_write_bytes(self.config_file, payload)
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide config, loading it on first use."""
+    return Config()
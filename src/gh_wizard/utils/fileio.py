@@ -0,0 +1,26 @@
+"""File I/O helpers."""
+
+import os
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write_bytes(path: Union[str, Path], payload: bytes) -> None:
+    """Write bytes to a file atomically.
+    
+    The payload is written to a sibling temp file which then replaces the
+    target, so a crash mid-write never leaves a truncated file behind.
+    
+    Args:
+        path: File to write
+        payload: Complete new file contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
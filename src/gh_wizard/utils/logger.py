@@ -1,13 +1,113 @@
 """Logging setup."""
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 
+from gh_wizard.utils.paths import BASE_DIR
 
+LOG_FILE = BASE_DIR / "wizard.log"
+
+# One formatter shared by every handler
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+_log_dir_ready = False
+
+# Records bound for the log file go through this queue; a single background
+# listener owns the FileHandler, so callers never block on file I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _ensure_log_dir() -> None:
+    """Create the log directory, at most once per process."""
+    global _log_dir_ready
+    if not _log_dir_ready:
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _log_dir_ready = True
+
+
+class FdFileHandler(logging.Handler):
+    """Append records to a file through a raw file descriptor.
+    
+    Each record is encoded and passed to a single os.write, without the
+    text and buffer layers of a regular file object. The file is opened on
+    the first record, like FileHandler with delay=True.
+    """
+
+    def __init__(self, filename: Path):
+        """Initialize the handler.
+        
+        Args:
+            filename: File to append to, created if missing
+        """
+        super().__init__()
+        self.filename = filename
+        self._fd: Optional[int] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one formatted record to the file."""
+        try:
+            if self._fd is None:
+                self._fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            os.write(self._fd, (self.format(record) + "\n").encode("utf-8"))
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close the file descriptor."""
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+def _start_listener() -> None:
+    """Start the process-wide file logging listener, at most once."""
+    global _listener
+    if _listener is None:
+        _ensure_log_dir()
+        # Opened on first record, and written in batches: the buffer is
+        # flushed when full, on an error, and at exit
+        file_handler = FdFileHandler(LOG_FILE)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FORMATTER)
+        buffered = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered.setLevel(logging.DEBUG)
+        _listener = logging.handlers.QueueListener(
+            _log_queue, buffered, respect_handler_level=True
+        )
+        _listener.start()
+        # atexit runs last-registered first: drain the queue, then flush
+        atexit.register(buffered.flush)
+        atexit.register(_listener.stop)
+
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Setup logger for a module.
     
+    Cached, so each logger is configured once per process however many
+    times it is requested.
+    
     Args:
         name: Logger name (usually __name__)
         level: Logging level
@@ -25,23 +125,13 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     # Console handler
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
-    
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
-    # File handler (optional)
-    log_file = Path.home() / ".ghwizard" / "wizard.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+    # File handler (optional), written from the listener thread
     try:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _start_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
     except Exception as e:
         logger.warning(f"Could not setup file logging: {e}")
     
@@ -0,0 +1,14 @@
+"""Filesystem locations."""
+
+import os
+from pathlib import Path
+
+# Wizard data directory, resolved once per process. GHWIZARD_HOME overrides
+# the default ~/.ghwizard, e.g. to keep test runs out of the real one.
+BASE_DIR: Path = Path(os.environ.get("GHWIZARD_HOME") or Path.home() / ".ghwizard")
+
+try:
+    BASE_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    # Reported by whichever store first fails to write there
+    pass
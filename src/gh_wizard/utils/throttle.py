@@ -0,0 +1,69 @@
+"""Throttled saving for the on-disk stores."""
+
+import atexit
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+
+# Every saver still alive; held weakly so stores can be garbage collected
+_live_savers: "weakref.WeakSet[ThrottledSaver]" = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    """Write out changes still pending in any live saver."""
+    for saver in list(_live_savers):
+        saver.flush()
+
+
+atexit.register(_flush_all)
+
+
+class ThrottledSaver:
+    """Run a save callback at most once per interval without dropping changes.
+    
+    The first change after a quiet interval is saved at once. Changes made
+    within the interval are coalesced and saved by a single timer when it
+    ends, so each one reaches disk within `interval` seconds. Pending changes
+    are also saved at exit.
+    """
+
+    def __init__(self, save: Callable[[], None], interval: float):
+        """Initialize saver.
+        
+        Args:
+            save: Writes the store's current state; called with `lock` held
+            interval: Minimum seconds between saves
+        """
+        self._save = save
+        self.interval = interval
+        # Reentrant, so owners can hold it around a change and mark_dirty()
+        self.lock = threading.RLock()
+        self._dirty = False
+        self._last_save = float("-inf")
+        self._timer: Optional[threading.Timer] = None
+        _live_savers.add(self)
+
+    def mark_dirty(self) -> None:
+        """Record a change, saving now or when the current interval ends."""
+        with self.lock:
+            self._dirty = True
+            wait = self._last_save + self.interval - time.monotonic()
+            if wait <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Save pending changes now."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_save = time.monotonic()
+            self._save()
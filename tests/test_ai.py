@@ -0,0 +1,101 @@
+"""Tests for pattern learning."""
+
+from gh_wizard.ai import PatternLearner
+
+
+def test_record_action_persistence(tmp_path):
+    """Test actions are appended to the history file and reloaded."""
+    history_file = tmp_path / "history.jsonl"
+    learner = PatternLearner(history_file=history_file)
+
+    learner.record_action("commit", {"repo": "gh-wizard"})
+    learner.record_action("pr_created", {"repo": "gh-wizard"})
+    learner.close()
+
+    assert len(history_file.read_bytes().splitlines()) == 2
+
+    learner2 = PatternLearner(history_file=history_file)
+    assert len(learner2.history) == 2
+    assert learner2.history[0]["type"] == "commit"
+    assert isinstance(learner2.history[0]["timestamp"], float)
+    assert learner2.history[1]["details"]["repo"] == "gh-wizard"
+
+
+def test_corrupt_history_line_skipped(tmp_path):
+    """Test a truncated trailing line doesn't lose earlier history."""
+    history_file = tmp_path / "history.jsonl"
+    learner = PatternLearner(history_file=history_file)
+    learner.record_action("commit", {})
+    learner.close()
+
+    with open(history_file, "ab") as f:
+        f.write(b'{"timestamp": "2024-')
+
+    learner2 = PatternLearner(history_file=history_file)
+    assert len(learner2.history) == 1
+
+
+def test_common_patterns(tmp_path):
+    """Test action and repo frequencies."""
+    learner = PatternLearner(history_file=tmp_path / "history.jsonl")
+    learner.record_action("commit", {"repo": "a"})
+    learner.record_action("commit", {"repo": "b"})
+    learner.record_action("commit", {"repo": "a"})
+    learner.record_action("issue_resolved", {})
+
+    patterns = learner.get_common_patterns(days=7)
+    assert patterns["total_actions"] == 4
+    assert patterns["action_distribution"] == {"commit": 3, "issue_resolved": 1}
+    assert patterns["repo_distribution"] == {"a": 2, "b": 1}
+    assert list(patterns["action_distribution"]) == ["commit", "issue_resolved"]
+
+
+def test_common_patterns_window(tmp_path):
+    """Test old actions age out of the rolling window."""
+    history_file = tmp_path / "history.jsonl"
+    history_file.write_bytes(b'{"timestamp":"2000-01-01T00:00:00","type":"commit","details":{"repo":"old"}}\n')
+
+    learner = PatternLearner(history_file=history_file)
+    learner.record_action("commit", {"repo": "new"})
+
+    patterns = learner.get_common_patterns(days=7)
+    assert patterns["total_actions"] == 1
+    assert patterns["repo_distribution"] == {"new": 1}
+
+    patterns = learner.get_common_patterns(days=365 * 100)
+    assert patterns["total_actions"] == 2
+    assert patterns["action_distribution"] == {"commit": 2}
+
+
+def test_legacy_history_imported_once(tmp_path):
+    """Test the old JSON array history is carried over on first run."""
+    legacy_file = tmp_path / "history.json"
+    legacy_file.write_text(
+        '[{"timestamp": "2024-01-01T12:00:00", "type": "commit", "details": {"repo": "a"}},'
+        ' {"timestamp": "2024-01-02T12:00:00", "type": "pr_created", "details": {}}]'
+    )
+    history_file = tmp_path / "history.jsonl"
+
+    learner = PatternLearner(history_file=history_file)
+    assert [e["type"] for e in learner.history] == ["commit", "pr_created"]
+    assert not legacy_file.exists()
+    assert (tmp_path / "history.json.migrated").exists()
+
+    learner.record_action("commit", {})
+    learner.close()
+    assert len(PatternLearner(history_file=history_file).history) == 3
+
+
+def test_clock_stepping_back_keeps_window_sorted(tmp_path, monkeypatch):
+    """Test an earlier clock reading doesn't break the rolling window."""
+    history_file = tmp_path / "history.jsonl"
+    history_file.write_bytes(
+        b'{"timestamp":2000000000.0,"type":"commit","details":{}}\n'
+        b'{"timestamp":1000000000.0,"type":"commit","details":{}}\n'
+    )
+    learner = PatternLearner(history_file=history_file)
+    monkeypatch.setattr("gh_wizard.ai.time.time", lambda: 1500000000.0)
+    learner.record_action("pr_created", {})
+
+    assert learner._timestamps == sorted(learner._timestamps)
+    assert learner.get_common_patterns(days=7)["total_actions"] == 3
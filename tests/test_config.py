@@ -0,0 +1,67 @@
+"""Tests for configuration management."""
+
+import orjson
+
+from gh_wizard.pomodoro import BreakReminder
+from gh_wizard.utils.config import Config, get_config
+
+
+def _on_disk(config_file):
+    return orjson.loads(config_file.read_bytes())
+
+
+def test_config_defaults_layering(tmp_path):
+    """Test that stored values sit over the defaults without copying them."""
+    config_file = tmp_path / "config.json"
+    config_file.write_bytes(orjson.dumps({"theme": "dark"}))
+    config = Config(config_file)
+    
+    assert config.get("theme") == "dark"
+    assert config.get("pomodoro_work_minutes") == 25
+    assert config.get("missing", "fallback") == "fallback"
+    
+    config.set("dnd_mode", True)
+    config.flush()
+    assert Config.DEFAULT_CONFIG["dnd_mode"] is False
+    assert Config.DEFAULT_CONFIG["theme"] == "auto"
+
+
+def test_config_saves_are_throttled(tmp_path):
+    """Test that quick successive changes are written together on flush."""
+    config_file = tmp_path / "config.json"
+    config = Config(config_file)
+    
+    # First change writes immediately, the next one waits for the interval
+    config.set("theme", "dark")
+    config.update({"theme": "light", "dnd_mode": True})
+    assert _on_disk(config_file)["theme"] == "dark"
+    assert _on_disk(config_file)["dnd_mode"] is False
+    
+    config.flush()
+    assert _on_disk(config_file)["theme"] == "light"
+    assert _on_disk(config_file)["dnd_mode"] is True
+
+
+def test_config_write_is_atomic(tmp_path):
+    """Test that saves replace the file and leave no temp file behind."""
+    config_file = tmp_path / "config.json"
+    config = Config(config_file)
+    config.set("theme", "dark")
+    config.flush()
+    
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+    assert Config(config_file).get("theme") == "dark"
+
+
+def test_config_corrupt_file_falls_back_to_defaults(tmp_path):
+    """Test that a file not holding a JSON object is ignored."""
+    config_file = tmp_path / "config.json"
+    config_file.write_bytes(b"[1, 2]")
+    
+    assert Config(config_file).get("theme") == "auto"
+
+
+def test_break_reminder_uses_shared_config():
+    """Test that reminders share one config instead of each loading their own."""
+    assert BreakReminder().config is get_config()
+    assert BreakReminder().config is BreakReminder().config
@@ -0,0 +1,98 @@
+"""Tests for notification management."""
+
+import pytest
+from pydantic import ValidationError
+
+from gh_wizard.notifications import Notification, NotificationManager, NotificationPriority
+
+
+def _note(title, priority=NotificationPriority.NORMAL, repo=None):
+    return Notification(title=title, message="", priority=priority, repo=repo)
+
+
+def test_dnd_mode_only_lets_critical_through():
+    """Test that Do Not Disturb suppresses everything below critical."""
+    manager = NotificationManager(dnd_mode=True)
+
+    assert not manager.add(_note("build", NotificationPriority.HIGH))
+    assert manager.add(_note("outage", NotificationPriority.CRITICAL))
+    assert [n.title for n in manager.notifications] == ["outage"]
+
+
+def test_watched_repos_filter():
+    """Test that only watched repos pass, and repo-less notifications always do."""
+    manager = NotificationManager(watched_repos=["a"])
+
+    assert manager.add(_note("one", repo="a"))
+    assert not manager.add(_note("two", repo="b"))
+    assert manager.add(_note("three"))
+    assert manager.watched_repos == frozenset({"a"})
+
+
+def test_dnd_and_watched_repos_combined():
+    """Test that both filters apply when both are set."""
+    manager = NotificationManager(dnd_mode=True, watched_repos=["a"])
+
+    assert not manager.add(_note("one", NotificationPriority.CRITICAL, repo="b"))
+    assert not manager.add(_note("two", NotificationPriority.LOW, repo="a"))
+    assert manager.add(_note("three", NotificationPriority.CRITICAL, repo="a"))
+
+
+def test_setters_rebuild_filter():
+    """Test that changing settings takes effect on the next add()."""
+    manager = NotificationManager()
+    assert manager.add(_note("one", NotificationPriority.LOW, repo="b"))
+
+    manager.dnd_mode = True
+    assert not manager.add(_note("two", NotificationPriority.LOW))
+    manager.dnd_mode = False
+
+    manager.watched_repos = ["a"]
+    assert not manager.add(_note("three", repo="b"))
+    manager.watched_repos = None
+    assert manager.watched_repos == frozenset()
+    assert manager.add(_note("four", repo="b"))
+
+
+def test_batch_summary():
+    """Test that the summary counts notifications from most to least urgent."""
+    manager = NotificationManager()
+    assert manager.batch_summary() is None
+
+    manager.add(_note("one", NotificationPriority.LOW))
+    manager.add(_note("two", NotificationPriority.CRITICAL))
+    manager.add(_note("three", NotificationPriority.LOW))
+    assert manager.batch_summary() == "1 critical notification(s), 2 low notification(s)"
+
+    manager.clear()
+    assert manager.batch_summary() is None
+
+
+def test_get_by_priority_and_repo():
+    """Test lookups by priority and repo, and that they return copies."""
+    manager = NotificationManager()
+    manager.add(_note("one", NotificationPriority.HIGH, repo="a"))
+    manager.add(_note("two", repo="a"))
+    manager.add(_note("three", NotificationPriority.HIGH, repo="b"))
+
+    assert [n.title for n in manager.get_by_priority(NotificationPriority.HIGH)] == ["one", "three"]
+    assert [n.title for n in manager.get_by_priority("normal")] == ["two"]
+    assert [n.title for n in manager.get_by_repo("a")] == ["one", "two"]
+    assert manager.get_by_repo("missing") == []
+
+    manager.get_by_repo("a").clear()
+    assert len(manager.get_by_repo("a")) == 2
+
+    manager.clear()
+    assert manager.get_by_priority(NotificationPriority.HIGH) == []
+    assert manager.get_by_repo("a") == []
+
+
+def test_notification_is_frozen():
+    """Test that notifications cannot be changed and can be hashed."""
+    note = _note("one")
+
+    with pytest.raises(ValidationError):
+        note.title = "changed"
+    assert note.tags == ()
+    assert len({note, _note("one")}) == 1
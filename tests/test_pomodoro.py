@@ -1,5 +1,5 @@
+import asyncio
 import pytest
-import time
 from gh_wizard.pomodoro import PomodoroSession
 
 
@@ -20,7 +20,8 @@ def test_pomodoro_start_stop():
     assert session.is_running is False
 
 def test_pomodoro_pause_resume():
-    session = PomodoroSession()
+    now = [1000.0]
+    session = PomodoroSession(clock=lambda: now[0])
     session.start()
     assert session.is_paused is False
     
@@ -28,13 +29,11 @@ def test_pomodoro_pause_resume():
     assert session.is_paused is True
     assert session.paused_time is not None
     
-    # Wait a bit
-    time.sleep(0.1)
-    
+    now[0] += 0.5
     session.resume()
     assert session.is_paused is False
     assert session.paused_time is None
-    assert session.pause_offset > 0
+    assert session.pause_offset == 0.5
 
 def test_pomodoro_next_phase():
     session = PomodoroSession(work_minutes=1, short_break_minutes=1)
@@ -48,3 +47,35 @@ def test_pomodoro_next_phase():
     
     session.next_phase()
     assert session.current_phase == "work"
+
+def test_pomodoro_run_completes_phase():
+    session = PomodoroSession(work_minutes=0)
+    session.start()
+    ticks = []
+    completed = []
+    
+    asyncio.run(session.run(ticks.append, completed.append))
+    assert ticks == [session]
+    assert completed == [session]
+
+def test_pomodoro_reads_injected_clock():
+    now = [1000.0]
+    session = PomodoroSession(work_minutes=1, clock=lambda: now[0])
+    session.start()
+    now[0] += 30
+    assert session.get_elapsed_seconds() == 30
+    assert session.get_remaining_seconds() == 30
+    assert session.is_phase_complete() is False
+
+def test_pomodoro_countdown_stands_still_while_paused():
+    now = [1000.0]
+    session = PomodoroSession(work_minutes=1, clock=lambda: now[0])
+    session.start()
+    now[0] += 10.5
+    session.pause()
+    now[0] += 5
+    assert session.get_remaining_seconds() == 50
+    assert session.get_elapsed_seconds() == 10
+    
+    session.resume()
+    assert session.get_remaining_seconds() == 50
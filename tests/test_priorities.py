@@ -1,9 +1,9 @@
 import pytest
 from gh_wizard.priorities import EisenhowerMatrix, Task, Quadrant, Priority
 
-@pytest.fixture
-def temp_matrix_file(tmp_path):
-    return tmp_path / "test_matrix.json"
+@pytest.fixture(scope="module")
+def temp_matrix_file(tmp_path_factory):
+    return tmp_path_factory.mktemp("matrix") / "test_matrix.json"
 
 def test_task_quadrant():
     t1 = Task(id="1", title="Urgent Important", is_urgent=True, is_important=True)
@@ -51,3 +51,17 @@ def test_mark_complete():
     
     matrix.mark_complete("1")
     assert matrix.tasks["1"].completed is True
+
+def test_readd_task_after_flags_changed():
+    matrix = EisenhowerMatrix()
+    task = Task(id="1", title="Test Task", is_urgent=True, is_important=True)
+    matrix.add_task(task)
+    
+    # Changed in place after filing, then re-added to re-file it
+    task.is_urgent = False
+    matrix.add_task(task)
+    
+    assert "1" not in matrix.quadrants[Quadrant.Q1]
+    assert list(matrix.quadrants[Quadrant.Q2]) == ["1"]
+    assert [p for p, _, _ in matrix._priority_sorted] == [Priority.HIGH]
+    assert matrix.get_priority_tasks() == [task]
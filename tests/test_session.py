@@ -1,16 +1,19 @@
 """Tests for session management."""
 
+import os
 import pytest
-import tempfile
+import time
 from pathlib import Path
 from gh_wizard.session import SessionManager
 
 
-@pytest.fixture
-def temp_config_dir():
-    """Create temporary config directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+@pytest.fixture(scope="module")
+def temp_config_dir(tmp_path_factory):
+    """Create a temporary config directory shared by this module's tests.
+    
+    Every test starts its own uniquely named session, so they don't collide.
+    """
+    return str(tmp_path_factory.mktemp("config"))
 
 
 def test_session_start(temp_config_dir):
@@ -67,3 +70,51 @@ def test_session_breadcrumbs(temp_config_dir):
     session = manager._load_session(session_id)
     assert len(session["breadcrumbs"]) == 2
     assert session["breadcrumbs"][0]["message"] == "Started work"
+
+
+def test_last_session_is_most_recently_saved(temp_config_dir):
+    """Test that the last session follows the latest save."""
+    manager = SessionManager(config_dir=temp_config_dir)
+    first_id = manager.start("First")
+    second_id = manager.start("Second")
+    
+    # Bump the first session's mtime past the second's
+    first_file = manager.sessions_dir / f"{first_id}.json"
+    stat = first_file.stat()
+    os.utime(first_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    
+    assert manager.get_last_session()["session_id"] == first_id
+    assert {first_id, second_id} <= {s["session_id"] for s in manager.list_sessions()}
+
+
+def test_session_updates_are_batched(temp_config_dir):
+    """Test that quick successive updates are written on flush."""
+    manager = SessionManager(config_dir=temp_config_dir)
+    session_id = manager.start("Test Session")
+    
+    manager.add_breadcrumb("First", session_id)
+    manager.add_breadcrumb("Second", session_id)
+    on_disk = SessionManager(config_dir=temp_config_dir)._load_session(session_id)
+    assert len(on_disk["breadcrumbs"]) == 1
+    
+    manager.flush()
+    on_disk = SessionManager(config_dir=temp_config_dir)._load_session(session_id)
+    assert len(on_disk["breadcrumbs"]) == 2
+
+
+def test_batched_update_is_written_without_flush(temp_config_dir, monkeypatch):
+    """Test that an update held back by the interval still reaches disk."""
+    monkeypatch.setattr("gh_wizard.session.SAVE_INTERVAL", 0.05)
+    manager = SessionManager(config_dir=temp_config_dir)
+    session_id = manager.start("Test Session")
+    
+    manager.add_breadcrumb("First", session_id)
+    manager.add_breadcrumb("Second", session_id)
+    
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        on_disk = SessionManager(config_dir=temp_config_dir)._load_session(session_id)
+        if len(on_disk["breadcrumbs"]) == 2:
+            break
+        time.sleep(0.01)
+    assert len(on_disk["breadcrumbs"]) == 2
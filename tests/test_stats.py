@@ -1,4 +1,5 @@
 import pytest
+import time
 from unittest.mock import MagicMock, patch
 from datetime import date
 from gh_wizard.stats import StatsManager, DailyStats
@@ -36,6 +37,43 @@ def test_stats_manager(tmp_path):
     assert stats2.work_sessions == 1
     assert stats2.work_minutes == 25
 
+def test_stats_saves_are_debounced(tmp_path):
+    stats_file = tmp_path / "stats.json"
+    manager = StatsManager(stats_file=stats_file)
+    
+    # First save writes immediately, the next one waits for the interval
+    manager.record_work_session(25)
+    manager.record_work_session(30)
+    assert StatsManager(stats_file=stats_file).get_today_stats().work_sessions == 1
+    
+    manager.flush()
+    assert StatsManager(stats_file=stats_file).get_today_stats().work_sessions == 2
+
+def test_stats_throttled_save_reaches_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr("gh_wizard.stats.SAVE_INTERVAL", 0.05)
+    stats_file = tmp_path / "stats.json"
+    manager = StatsManager(stats_file=stats_file)
+    
+    manager.record_work_session(25)
+    manager.record_work_session(30)
+    
+    # The held-back save is written when the interval ends, without flush()
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if StatsManager(stats_file=stats_file).get_today_stats().work_sessions == 2:
+            break
+        time.sleep(0.01)
+    assert StatsManager(stats_file=stats_file).get_today_stats().work_sessions == 2
+
+def test_stats_sum_last_n_days(tmp_path):
+    manager = StatsManager(stats_file=tmp_path / "stats.json")
+    manager.stats["2000-01-01"] = DailyStats(date="2000-01-01", work_minutes=50)
+    manager.record_work_session(25)
+    manager.record_work_session(20)
+    
+    assert manager.sum_last_n_days(7) == 45
+    assert manager.sum_last_n_days(7, "work_sessions") == 2
+
 def test_pomodoro_notify():
     with patch("builtins.print") as mock_print:
         notify_phase_complete("work")
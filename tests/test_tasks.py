@@ -39,3 +39,35 @@ def test_default_breakdown():
     
     assert len(steps) > 0
     assert "Plan" in [step["name"] for step in steps]
+
+
+def _first_step(task):
+    return TaskBreakdown().breakdown(task)[0]["name"]
+
+
+@pytest.mark.parametrize("task, first_step", [
+    # Keyword precedence decides, not the position in the description
+    ("Implement release fix", "Reproduce Bug"),
+    ("Ship the refactor", "Update CHANGELOG"),
+    # Terms sharing characters are both found: "patch" outranks "ship"
+    ("shipatch", "Reproduce Bug"),
+])
+def test_overlapping_terms_precedence(task, first_step):
+    """Test which pattern wins when a description holds several terms."""
+    assert _first_step(task) == first_step
+
+
+def test_terms_match_any_case():
+    """Test that matching ignores case."""
+    assert _first_step("RELEASE v2.0") == "Update CHANGELOG"
+    assert _first_step("ReFaCtOr the parser") == "Plan Refactoring"
+
+
+@pytest.mark.parametrize("task, first_step", [
+    ("Address review comments", "Create Feature Branch"),
+    ("Handle prefix parsing", "Reproduce Bug"),
+    ("Clean up the refactoring notes", "Plan Refactoring"),
+])
+def test_terms_match_inside_words(task, first_step):
+    """Test that a term inside a longer word still counts as a match."""
+    assert _first_step(task) == first_step